@@ -8,16 +8,25 @@ translates it into concrete `ValidatorBase` instances.
 
 from __future__ import annotations
 
+import functools
+import os
+import pkgutil
+import sys
+from types import ModuleType
 from importlib import import_module
 from pathlib import Path
-from typing import Any, Dict, List, Sequence
-import sys
-import yaml
+from dataclasses import dataclass, field, fields
+from typing import IO, Any, Dict, List, Protocol, Sequence, Tuple, TypeVar
 from pydantic import BaseModel, Field, model_validator
 
 from src.expectations.validators.base import ValidatorBase
 from src.expectations.runner import ValidatorBinding
 
+try:  # optional C-accelerated JSON parser
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - fall back to the stdlib
+    from json import loads as _json_loads
+
 
 # --------------------------------------------------------------------------- #
 # Model definitions                                                           #
@@ -54,49 +63,30 @@ class ExpectationSuiteConfig(BaseModel):
         Dynamically import the validator classes, instantiate them, and
         return the bindings the runner understands.
         """
-        bindings: List[ValidatorBinding] = []
-
-        from src.expectations.validators.custom import SqlErrorRowsValidator
-
-        for cfg in self.expectations:
-            if cfg.expectation_type == "SqlErrorRows":
-                cls = SqlErrorRowsValidator
-            else:
-                cls = _resolve_validator_class(cfg.expectation_type)
-            if not issubclass(cls, ValidatorBase):
-                raise TypeError(f"{cfg.expectation_type} is not a ValidatorBase")
-
-            init_kwargs = dict(getattr(cfg, "kwargs", {}) or {})
-            if cfg.column:
-                init_kwargs["column"] = cfg.column
-            if cfg.where:
-                init_kwargs["where"] = cfg.where
-            if cfg.sql:
-                init_kwargs["sql"] = cfg.sql
-            if cfg.max_error_rows is not None:
-                init_kwargs["max_error_rows"] = cfg.max_error_rows
-            if cfg.threshold is not None:
-                init_kwargs["threshold"] = cfg.threshold
-            if cfg.severity:
-                init_kwargs["severity"] = cfg.severity
-
-            validator = cls(**init_kwargs)
-            bindings.append((self.engine, self.table, validator))
-
-        return bindings
+        return _build_suite_validators(self)
 
     # ------------------------------------------------------------------ #
     # I/O                                                                 #
     # ------------------------------------------------------------------ #
     @classmethod
     def from_yaml(cls, path: str | Path) -> "ExpectationSuiteConfig":
-        with open(path, "r") as fh:
-            return cls.model_validate(yaml.safe_load(fh))
+        """Load a suite from YAML."""
+        return _load_config(cls, path, "yaml")
+
+    @classmethod
+    def from_yaml_fast(cls, path: str | Path) -> "_FastSuiteConfig":
+        """Load a *trusted* YAML suite without Pydantic validation.
+
+        Returns a slotted dataclass exposing the same attributes and
+        ``build_validators()``; intended for large in-repo suites where
+        model validation dominates load time.
+        """
+        with open(path, "rb") as fh:
+            return _FastSuiteConfig.from_dict(_yaml_load(fh))
 
     @classmethod
     def from_json(cls, path: str | Path) -> "ExpectationSuiteConfig":
-        with open(path, "r") as fh:
-            return cls.model_validate_json(fh.read())
+        return _load_config(cls, path, "json")
 
     # optional “smart” loader ---------------------
     @classmethod
@@ -108,11 +98,20 @@ class ExpectationSuiteConfig(BaseModel):
             return cls.from_json(path)
         raise ValueError(f"Unsupported config extension: {ext}")
 
+    @classmethod
+    def peek_header(cls, path: str | Path) -> Dict[str, str]:
+        """Return ``suite_name``/``engine``/``table`` without parsing expectations.
+
+        Only the lines before the top-level ``expectations:`` key are parsed;
+        the whole file is read as a fallback when the header is incomplete.
+        """
+        return _peek_yaml_header(path, "expectations", ("suite_name", "engine", "table"))
+
     # round-trip helper ----------------------------
     def to_yaml(self) -> str:
         """Serialize this config back to YAML."""
         data = self.model_dump(exclude_defaults=True, exclude_none=True)
-        return yaml.safe_dump(data, sort_keys=False)
+        return _yaml_dump(data)
 
 
 class SLAConfig(BaseModel):
@@ -136,13 +135,11 @@ class SLAConfig(BaseModel):
     # ------------------------------------------------------------------ #
     @classmethod
     def from_yaml(cls, path: str | Path) -> "SLAConfig":
-        with open(path, "r") as fh:
-            return cls.model_validate(yaml.safe_load(fh))
+        return _load_config(cls, path, "yaml")
 
     @classmethod
     def from_json(cls, path: str | Path) -> "SLAConfig":
-        with open(path, "r") as fh:
-            return cls.model_validate_json(fh.read())
+        return _load_config(cls, path, "json")
 
     @classmethod
     def from_file(cls, path: str | Path) -> "SLAConfig":
@@ -153,33 +150,259 @@ class SLAConfig(BaseModel):
             return cls.from_json(path)
         raise ValueError(f"Unsupported config extension: {ext}")
 
+    @classmethod
+    def peek_header(cls, path: str | Path) -> Dict[str, str]:
+        """Return ``sla_name`` without parsing the contained suites."""
+        return _peek_yaml_header(path, "suites", ("sla_name",))
+
     # round-trip helper ----------------------------
     def to_yaml(self) -> str:
         """Serialize this SLA config back to YAML."""
         data = self.model_dump(exclude_defaults=True, exclude_none=True)
-        return yaml.safe_dump(data, sort_keys=False)
+        return _yaml_dump(data)
+
+
+# --------------------------------------------------------------------------- #
+# Lightweight twins for trusted inputs                                        #
+# --------------------------------------------------------------------------- #
+class _ExpectationLike(Protocol):
+    expectation_type: str
+    column: str | None
+    where: str | None
+    sql: str | None
+    max_error_rows: int | None
+    severity: str | None
+    threshold: float | int | None
+
+
+class _SuiteLike(Protocol):
+    engine: str
+    table: str
+
+    @property
+    def expectations(self) -> Sequence[_ExpectationLike]: ...
+
+
+@dataclass(slots=True)
+class _FastExpectationConfig:
+    """Unvalidated counterpart of :class:`ExpectationConfig`."""
+
+    expectation_type: str
+    column: str | None = None
+    where: str | None = None
+    sql: str | None = None
+    max_error_rows: int | None = None
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    tags: List[str] = field(default_factory=list)
+    severity: str | None = None
+    threshold: float | int | None = None
+
+
+# Unknown keys in an expectation entry are ignored, as pydantic does.
+_FAST_EXPECTATION_FIELDS = frozenset(f.name for f in fields(_FastExpectationConfig))
+
+
+@dataclass(slots=True)
+class _FastSuiteConfig:
+    """Unvalidated counterpart of :class:`ExpectationSuiteConfig`.
+
+    Fields are assigned as-is (no coercion), so only use it for trusted,
+    in-repo configuration files.
+    """
+
+    suite_name: str
+    engine: str
+    table: str
+    expectations: List[_FastExpectationConfig]
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "_FastSuiteConfig":
+        return cls(
+            suite_name=data["suite_name"],
+            engine=data["engine"],
+            table=data["table"],
+            expectations=[
+                _FastExpectationConfig(
+                    **{k: v for k, v in item.items() if k in _FAST_EXPECTATION_FIELDS}
+                )
+                for item in data["expectations"]
+            ],
+        )
+
+    def build_validators(self) -> Sequence[ValidatorBinding]:
+        return _build_suite_validators(self)
 
 
 # --------------------------------------------------------------------------- #
 # Internal helpers                                                            #
 # --------------------------------------------------------------------------- #
+# Config attributes forwarded to the validator constructor: the first group
+# only when truthy (an empty ``where`` means no filter), the second whenever
+# set, since 0 is a meaningful limit.
+_PASSTHROUGH_FIELDS = ("column", "where", "sql", "severity")
+_PASSTHROUGH_NUMERIC_FIELDS = ("max_error_rows", "threshold")
+
+
+def _build_suite_validators(suite: _SuiteLike) -> List[ValidatorBinding]:
+    """Instantiate the validators of *suite* (Pydantic model or fast twin)."""
+    bindings: List[ValidatorBinding] = []
+
+    from src.expectations.validators.custom import SqlErrorRowsValidator
+
+    resolved: Dict[str, type[ValidatorBase]] = {"SqlErrorRows": SqlErrorRowsValidator}
+
+    for cfg in suite.expectations:
+        cls = resolved.get(cfg.expectation_type)
+        if cls is None:
+            cls = _resolve_validator_class(cfg.expectation_type)
+            if not issubclass(cls, ValidatorBase):
+                raise TypeError(f"{cfg.expectation_type} is not a ValidatorBase")
+            resolved[cfg.expectation_type] = cls
+
+        init_kwargs = {
+            **(getattr(cfg, "kwargs", None) or {}),
+            **{k: v for k in _PASSTHROUGH_FIELDS if (v := getattr(cfg, k, None))},
+            **{
+                k: v
+                for k in _PASSTHROUGH_NUMERIC_FIELDS
+                if (v := getattr(cfg, k, None)) is not None
+            },
+        }
+
+        validator = cls(**init_kwargs)
+        bindings.append((suite.engine, suite.table, validator))
+
+    return bindings
+
+
+@functools.lru_cache(maxsize=None)
+def _yaml_backend() -> Tuple[ModuleType, type, type]:
+    """Import PyYAML on first use and pick the fastest safe loader/dumper.
+
+    libyaml's C implementations are several times faster than the
+    pure-Python ones and share the same "safe" semantics.
+    """
+    import yaml
+
+    try:
+        from yaml import CSafeDumper as dumper, CSafeLoader as loader
+    except ImportError:  # pragma: no cover - PyYAML built without libyaml
+        from yaml import SafeDumper as dumper, SafeLoader as loader
+    return yaml, loader, dumper
+
+
+def _yaml_load(stream: IO[bytes] | bytes) -> Any:
+    yaml, loader, _ = _yaml_backend()
+    return yaml.load(stream, Loader=loader)
+
+
+def _yaml_dump(data: Any) -> str:
+    yaml, _, dumper = _yaml_backend()
+    return yaml.dump(data, Dumper=dumper, sort_keys=False)
+
+
+def _peek_yaml_header(
+    path: str | Path, body_key: str, required: Sequence[str]
+) -> Dict[str, str]:
+    """Parse the top-level scalars that precede *body_key* in a YAML file."""
+    stop = f"{body_key}:".encode()
+    lines: List[bytes] = []
+    with open(path, "rb") as fh:
+        for line in fh:
+            if line.startswith(stop) or (lines and not line.strip()):
+                break
+            if line.strip():
+                lines.append(line)
+    try:
+        data = _yaml_load(b"".join(lines))
+    except Exception:  # noqa: BLE001 - any YAML error → full parse below
+        data = None
+    if not isinstance(data, dict) or any(k not in data for k in required):
+        with open(path, "rb") as fh:
+            data = _yaml_load(fh)
+    return {k: v for k, v in data.items() if not isinstance(v, (dict, list))}
+
+
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_config_file(path: str, mtime_ns: int, size: int, fmt: str) -> Any:
+    """Parse *path* into plain data; ``mtime_ns``/``size`` only key the cache."""
+    # Binary mode: libyaml/orjson decode UTF-8 themselves, faster than
+    # Python's text-mode decoder.
+    with open(path, "rb") as fh:
+        return _yaml_load(fh) if fmt == "yaml" else _json_loads(fh.read())
+
+
+def _load_config(model: type[_ModelT], path: str | Path, fmt: str) -> _ModelT:
+    """Load *path* into *model*, re-using the parse of an unchanged file.
+
+    Only the parsed document is cached; every call validates a fresh model.
+    Containers nested inside ``kwargs`` values come from the cached parse,
+    so copy them before mutating.
+    """
+    path = os.path.abspath(path)
+    st = os.stat(path)
+    data = _parse_config_file(path, st.st_mtime_ns, st.st_size, fmt)
+    return model.model_validate(data)
+
+
+_VALIDATORS_PKG = "src.expectations.validators"
+_WELL_KNOWN_SUBMODULES = ("column", "table", "custom")
+
+
+def _discover_validator_modules() -> Tuple[str, ...]:
+    """Dotted names of every public module in the validators package.
+
+    The well-known sub-packages come first so their classes win name clashes.
+    """
+    pkg = import_module(_VALIDATORS_PKG)
+    found = {
+        info.name
+        for info in pkgutil.iter_modules(pkg.__path__)
+        if not info.name.startswith("_")
+    }
+    ordered = [sub for sub in _WELL_KNOWN_SUBMODULES if sub in found]
+    ordered += sorted(found.difference(_WELL_KNOWN_SUBMODULES))
+    return tuple(f"{_VALIDATORS_PKG}.{name}" for name in ordered)
+
+
+def _build_validator_registry(
+    module_names: Sequence[str],
+) -> Dict[str, type[ValidatorBase]]:
+    """Map class name -> validator class across *module_names*."""
+    registry: Dict[str, type[ValidatorBase]] = {}
+    for mod_name in module_names:
+        try:
+            mod = import_module(mod_name)
+        except ImportError:  # pragma: no cover - optional module missing
+            continue
+        for attr, obj in vars(mod).items():
+            if isinstance(obj, type) and issubclass(obj, ValidatorBase):
+                registry.setdefault(attr, obj)
+    return registry
+
+
+@functools.lru_cache(maxsize=None)
 def _resolve_validator_class(name: str) -> type[ValidatorBase]:
-    """Resolve *name* (e.g. ``ColumnNotNull``) to an actual class."""
+    """Resolve *name* (e.g. ``ColumnNotNull``) to an actual class.
 
-    pkg_root = "src.expectations.validators"
+    Results are memoised, so each distinct name is only looked up once per
+    process.
+    """
 
-    # 1) try modules already imported
-    for mod_name in list(sys.modules):
-        if mod_name.startswith(f"{pkg_root}."):
-            mod = sys.modules[mod_name]
-            if hasattr(mod, name):
-                return getattr(mod, name)
+    # 1) registry built from the validators package at import time
+    try:
+        return _VALIDATOR_REGISTRY[name]
+    except KeyError:
+        pass
 
-    # 2) attempt well-known sub-packages
-    for sub in ("column", "table", "custom"):
-        mod = import_module(f"{pkg_root}.{sub}")
-        if hasattr(mod, name):
-            return getattr(mod, name)
+    # 2) classes attached to those modules after the registry was built
+    for mod_name in _KNOWN_VALIDATOR_MODULES:
+        mod = sys.modules.get(mod_name)
+        if mod is not None and (cls := getattr(mod, name, None)) is not None:
+            return cls
 
     # 3) final fallback – dotted path supplied
     parts = name.split(".")
@@ -188,3 +411,9 @@ def _resolve_validator_class(name: str) -> type[ValidatorBase]:
     *pkg, cls_name = parts
     mod = import_module(".".join(pkg))
     return getattr(mod, cls_name)
+
+
+_KNOWN_VALIDATOR_MODULES: Tuple[str, ...] = _discover_validator_modules()
+_VALIDATOR_REGISTRY: Dict[str, type[ValidatorBase]] = _build_validator_registry(
+    _KNOWN_VALIDATOR_MODULES
+)
@@ -10,7 +10,7 @@ Highlights
 ----------
 * Accepts either **in-memory** (default) or on-disk database file.
 * Understands both **raw SQL strings** and **sqlglot Expressions**.
-* Implements ``run_many()`` with a *single* `duckdb.sql` call to reduce
+* Implements ``run_many()`` with a *single* fused query to reduce
   Python/DB round-trips when the engine receives several stand-alone
   validators.
 """
@@ -18,16 +18,94 @@ Highlights
 from __future__ import annotations
 
 import contextlib
+import functools
+import threading
+import weakref
 from pathlib import Path
-from queue import Queue
-from typing import List, Sequence
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Sequence
 
 import duckdb
 import pandas as pd
+import sqlglot
 from sqlglot import exp
 
 from src.expectations.engines.base import BaseEngine
 
+if TYPE_CHECKING:  # pragma: no cover - optional dependency
+    import pyarrow as pa
+
+# Compiled SQL text per expression and dialect; entries vanish with the AST
+# they describe.
+_COMPILED_SQL: "weakref.WeakKeyDictionary[exp.Expression, Dict[str, str]]" = (
+    weakref.WeakKeyDictionary()
+)
+_COMPILED_SQL_LOCK = threading.Lock()
+
+
+def _compile_cached(expression: exp.Expression, dialect: str) -> str:
+    """Return ``expression.sql(dialect=...)``, re-using earlier compilations.
+
+    Keys compare structurally, so identical ASTs built independently share
+    one entry; mutating an AST changes its hash and forces a recompile.
+    """
+    try:
+        return _COMPILED_SQL[expression][dialect]
+    except KeyError:
+        pass
+    sql = expression.sql(dialect=dialect, pretty=False)
+    with _COMPILED_SQL_LOCK:
+        _COMPILED_SQL.setdefault(expression, {})[dialect] = sql
+    return sql
+
+
+# Functions that change database or session state when evaluated.
+_SIDE_EFFECT_FUNCTIONS = frozenset({"nextval", "setval", "setseed"})
+# SELECT clauses that can change the row count or have effects of their own.
+_NON_FUSIBLE_ARGS = ("group", "having", "limit", "offset", "qualify", "connect", "into", "locks")
+
+
+def _is_single_row_select(expression: exp.Expression) -> bool:
+    """True when *expression* is a side-effect free ``SELECT`` that always
+    returns exactly one row: aggregates over a ``FROM`` without ``GROUP BY``
+    or ``LIMIT``, or constants without ``FROM``/``WHERE``."""
+    if not isinstance(expression, exp.Select) or any(
+        expression.args.get(arg) for arg in _NON_FUSIBLE_ARGS
+    ):
+        return False
+    for func in expression.find_all(exp.Func):
+        name = func.name if isinstance(func, exp.Anonymous) else func.sql_name()
+        if name.lower() in _SIDE_EFFECT_FUNCTIONS:
+            return False
+
+    projections = expression.expressions
+    names = [p.alias_or_name for p in projections]
+    if len(set(names)) != len(names):
+        return False
+    aggregates = 0
+    for projection in projections:
+        if projection.find(exp.Window, exp.Explode, exp.Unnest):
+            return False
+        if projection.find(exp.AggFunc):
+            aggregates += 1
+        elif projection.find(exp.Column, exp.Star):
+            return False
+    if expression.args.get("from_"):
+        return aggregates > 0
+    return not expression.args.get("where")
+
+
+@functools.lru_cache(maxsize=512)
+def _is_single_row_sql(sql: str, dialect: str) -> bool:
+    try:
+        statements = sqlglot.parse(sql, read=dialect)
+    except sqlglot.errors.SqlglotError:
+        return False
+    return (
+        len(statements) == 1
+        and statements[0] is not None
+        and _is_single_row_select(statements[0])
+    )
+
 
 class DuckDBEngine(BaseEngine):
     """
@@ -39,7 +117,11 @@ class DuckDBEngine(BaseEngine):
     read_only : bool, default False
         Open the database in read-only mode (ignored for in-memory DBs).
     pool_size : int, default 1
-        Number of connections to keep in the internal pool.
+        With the default ``1`` every thread shares the one connection, one
+        query at a time, so TEMP tables and ``SET``/``USE`` state are visible
+        from any thread.  Larger values let threads query concurrently: each
+        non-creating thread gets its own cursor on the connection, which
+        shares the database and catalog but *not* that session state.
     """
 
     def __init__(
@@ -52,13 +134,50 @@ class DuckDBEngine(BaseEngine):
         if pool_size < 1:
             raise ValueError("pool_size must be >= 1")
         self._dialect = "duckdb"
-        self._conns: List[duckdb.DuckDBPyConnection] = [
-            duckdb.connect(str(database), read_only=read_only)
-            for _ in range(pool_size)
-        ]
-        self._pool: "Queue[duckdb.DuckDBPyConnection]" = Queue()
-        for conn in self._conns:
-            self._pool.put(conn)
+        self._conn = duckdb.connect(str(database), read_only=read_only)
+        # pool_size=1: threads take turns on the connection itself.
+        self._shared = pool_size == 1
+        self._conn_lock = threading.RLock()
+        # Otherwise the creating thread uses the connection and other threads
+        # get a cursor (shares the database and catalog, not the client
+        # context).
+        self._owner_thread = threading.get_ident()
+        self._local = threading.local()
+        self._cursors: "weakref.WeakSet[duckdb.DuckDBPyConnection]" = weakref.WeakSet()
+        self._cursor_lock = threading.Lock()
+        # DataFrames registered via ``register_dataframe`` are client-context
+        # objects and must be re-registered on every cursor.
+        self._frames: Dict[str, pd.DataFrame] = {}
+        # Parsed statements keyed on SQL text – executing a parsed
+        # ``duckdb.Statement`` skips the parser on repeated queries.
+        self._parse = functools.lru_cache(maxsize=512)(self._parse_single)
+
+    # ------------------------------------------------------------------ #
+    # Per-thread cursors                                                 #
+    # ------------------------------------------------------------------ #
+    @contextlib.contextmanager
+    def _connection(self) -> Iterator[duckdb.DuckDBPyConnection]:
+        """Hold this thread's connection for the block: the shared one under
+        its lock, or the thread's own cursor when ``pool_size > 1``."""
+        if self._shared:
+            with self._conn_lock:
+                yield self._conn
+        else:
+            yield self._cursor()
+
+    def _cursor(self) -> duckdb.DuckDBPyConnection:
+        cur = getattr(self._local, "cursor", None)
+        if cur is None:
+            if threading.get_ident() == self._owner_thread:
+                cur = self._conn
+            else:
+                with self._cursor_lock:
+                    cur = self._conn.cursor()
+                    for name, df in self._frames.items():
+                        cur.register(name, df)
+                    self._cursors.add(cur)
+            self._local.cursor = cur
+        return cur
 
     # ------------------------------------------------------------------ #
     # BaseEngine interface                                               #
@@ -73,81 +192,181 @@ class DuckDBEngine(BaseEngine):
           dialect via ``sqlglot.Expression.sql()``.
         """
         if isinstance(sql, exp.Expression):
-            sql = sql.sql(dialect=self._dialect, pretty=False)
-        conn = self._pool.get()
+            sql = _compile_cached(sql, self._dialect)
+        with self._connection() as conn:
+            return self._execute(conn, sql)
+
+    def run_sql_arrow(self, sql: str | exp.Expression) -> "pa.Table":
+        """
+        Execute *sql* and return the result as a :class:`pyarrow.Table`.
+
+        Skips the pandas conversion done by :py:meth:`run_sql`, so wide or
+        long results avoid the object-dtype copy.  Requires ``pyarrow``.
+        """
+        if isinstance(sql, exp.Expression):
+            sql = _compile_cached(sql, self._dialect)
         try:
-            return conn.execute(str(sql)).fetchdf()
+            with self._connection() as conn:
+                return conn.execute(sql).fetch_arrow_table()
         except Exception as exc:  # pragma: no cover
             raise RuntimeError(f"DuckDB query failed: {sql}\n{exc}") from exc
-        finally:
-            self._pool.put(conn)
 
     def run_many(self, sql_statements: Sequence[str | exp.Expression]):  # noqa: D401
         """
-        Execute *sql_statements* sequentially and collect the results.
+        Execute *sql_statements*, fusing single-row queries into one round-trip.
 
-        DuckDB only returns a single result set when multiple statements are
-        chained together, so we simply loop over the statements and call
-        :py:meth:`run_sql` for each one.
+        When every statement is a side-effect free ``SELECT`` that always
+        yields one row – aggregates without ``GROUP BY``/``LIMIT``, or
+        constants – they are cross-joined as subqueries in one ``SELECT``
+        whose columns are renamed ``r<i>_<name>`` per statement, and the row
+        is split back into one DataFrame per statement, with the same dtypes
+        :py:meth:`run_sql` returns.  The decision is made from the parsed
+        SQL before anything runs; any other batch is run statement by
+        statement on the same connection.
         """
         if not sql_statements:
             return []
 
-        # DuckDB returns a single result set – we only use this method
-        # for stand-alone validators that each expect a scalar result,
-        # so we run them one-by-one and collect.
+        texts = [
+            _compile_cached(s, self._dialect) if isinstance(s, exp.Expression) else str(s)
+            for s in sql_statements
+        ]
+        execute = self._execute
+        fusible = len(texts) > 1 and all(
+            _is_single_row_select(s)
+            if isinstance(s, exp.Expression)
+            else _is_single_row_sql(text, self._dialect)
+            for s, text in zip(sql_statements, texts)
+        )
+        with self._connection() as conn:
+            if not fusible:
+                return [execute(conn, text) for text in texts]
+
+            fused = (
+                "SELECT "
+                + ", ".join(f"COLUMNS(q{i}.*) AS 'r{i}_\\0'" for i in range(len(texts)))
+                + " FROM "
+                + ", ".join(f"({t.strip().rstrip(';')}) AS q{i}" for i, t in enumerate(texts))
+            )
+            try:
+                row = conn.execute(fused).fetchdf()
+            except duckdb.Error:
+                # Binder/runtime errors: re-run individually so the failing
+                # statement is reported.  The batch is side-effect free.
+                return [execute(conn, text) for text in texts]
+
         dfs: List[pd.DataFrame] = []
-        for stmt in sql_statements:
-            dfs.append(self.run_sql(stmt))
+        for i in range(len(texts)):
+            prefix = f"r{i}_"
+            cols = [c for c in row.columns if c.startswith(prefix)]
+            dfs.append(row[cols].set_axis([c[len(prefix):] for c in cols], axis=1))
         return dfs
 
+    def _execute(self, conn: duckdb.DuckDBPyConnection, sql: str) -> pd.DataFrame:
+        try:
+            stmt = self._parse(sql)
+            return conn.execute(sql if stmt is None else stmt).fetchdf()
+        except Exception as exc:  # pragma: no cover
+            raise RuntimeError(f"DuckDB query failed: {sql}\n{exc}") from exc
+
+    def _parse_single(self, sql: str) -> "duckdb.Statement | None":
+        """Parse *sql*; ``None`` for multi-statement scripts (run as text)."""
+        with self._connection() as conn:
+            stmts = conn.extract_statements(sql)
+        return stmts[0] if len(stmts) == 1 else None
+
+    # ------------------------------------------------------------------ #
+    # Prepared statements                                                #
+    # ------------------------------------------------------------------ #
+    def prepare(self, sql: str) -> duckdb.Statement:
+        """
+        Parse *sql* once and return a reusable statement handle.
+
+        Handles are cached on the normalised SQL text, so preparing the same
+        template twice returns the same object.  Use ``?`` or ``$n``
+        placeholders and bind values via :py:meth:`run_prepared`.
+        """
+        stmt = self._parse(sql.strip())
+        if stmt is None:
+            raise ValueError("prepare() expects exactly one SQL statement")
+        return stmt
+
+    def run_prepared(
+        self, statement: duckdb.Statement, params: Sequence[Any] | None = None
+    ) -> pd.DataFrame:
+        """Execute a handle from :py:meth:`prepare`, binding *params*."""
+        try:
+            with self._connection() as conn:
+                return conn.execute(statement, params).fetchdf()
+        except Exception as exc:  # pragma: no cover
+            raise RuntimeError(f"DuckDB query failed: {statement.query}\n{exc}") from exc
+
     def list_columns(self, table: str) -> List[str]:  # noqa: D401
         """
         Return column names for *table* (schema-qualified ok).
 
-        Uses DuckDB's system PRAGMA: ``PRAGMA table_info('tbl')``.
+        Runs ``SELECT * FROM <table> LIMIT 0`` and reads the names from the
+        cursor description, so no rows or DataFrame are materialised.
         """
-        schema, t = (None, table)
-        if "." in table:
-            schema, t = table.rsplit(".", 1)
-
-        pragma = (
-            f"PRAGMA table_info('{schema}.{t}')" if schema else f"PRAGMA table_info('{t}')"
+        qualified = ".".join(
+            exp.to_identifier(part, quoted=True).sql(dialect=self._dialect)
+            for part in table.split(".")
         )
-        conn = self._pool.get()
-        try:
-            df = conn.execute(pragma).fetchdf()
-            return df["name"].tolist()
-        finally:
-            self._pool.put(conn)
+        with self._connection() as conn:
+            cur = conn.execute(f"SELECT * FROM {qualified} LIMIT 0")
+            return [d[0] for d in cur.description]
 
     def get_dialect(self) -> str:  # noqa: D401
         return self._dialect
 
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator[duckdb.DuckDBPyConnection]:
+        """
+        Run the block in one transaction on this thread's connection and
+        yield that connection; roll back if the block raises.
+
+        With ``pool_size=1`` the shared connection stays held by the calling
+        thread until the transaction ends; larger pools give each thread's
+        transaction its own cursor, so they proceed concurrently.
+        """
+        with self._connection() as conn:
+            conn.begin()
+            try:
+                yield conn
+            except BaseException:
+                conn.rollback()
+                raise
+            conn.commit()
+
     def close(self):  # noqa: D401
-        for conn in self._conns:
+        for cur in list(self._cursors):
             with contextlib.suppress(Exception):
-                conn.close()
+                cur.close()
+        with contextlib.suppress(Exception):
+            self._conn.close()
 
     # ------------------------------------------------------------------ #
     # Convenience helpers                                                #
     # ------------------------------------------------------------------ #
     @property
     def connection(self) -> duckdb.DuckDBPyConnection:  # pragma: no cover
-        """Expose one DuckDB connection (first in the pool)."""
-        return self._conns[0]
+        """Expose the underlying DuckDB connection."""
+        return self._conn
 
     def register_dataframe(self, name: str, df: pd.DataFrame) -> None:
         """Register *df* as a DuckDB view for ad-hoc testing."""
-        for conn in self._conns:
-            conn.register(name, df)
+        with self._cursor_lock:
+            self._frames[name] = df
+            self._conn.register(name, df)
+            for cur in list(self._cursors):
+                cur.register(name, df)
 
     def __repr__(self) -> str:  # pragma: no cover
 
         #db_name = getattr(self._conn, "database_name", ":memory:")
         #loc = ":memory:" if db_name == ":memory:" else Path(db_name).name
 
-        sample = self._conns[0]
+        sample = self._conn
         loc = ":memory:" if sample.database_name == ":memory:" else Path(sample.database_name).name
 
         return f"<DuckDBEngine db={loc!r}>"
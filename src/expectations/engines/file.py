@@ -1,17 +1,71 @@
 from __future__ import annotations
 
 import contextlib
+import fnmatch
 import glob
 import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
-from typing import List, Sequence
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 from sqlglot import exp
 
 from .base import BaseEngine
 from .duckdb import DuckDBEngine
 
+if TYPE_CHECKING:  # pragma: no cover - optional dependency
+    import pyarrow as pa
+
+# Above this many matches the ``stat`` calls are spread over a thread pool.
+_PARALLEL_STAT_THRESHOLD = 64
+
+_PARQUET_SUFFIXES = (".parquet", ".parq")
+_CSV_SUFFIXES = (".csv", ".tsv", ".csv.gz", ".tsv.gz")
+
+
+@dataclass(frozen=True, eq=False)
+class FileMetadata:
+    """Column-oriented path/size/mtime arrays for the files behind a view.
+
+    Iterating yields the ``{"path", "size", "modified"}`` dicts of the
+    original list-based format.
+    """
+
+    paths: np.ndarray
+    sizes: np.ndarray
+    mtimes: np.ndarray
+
+    @classmethod
+    def from_stats(cls, stats: Sequence[Tuple[str, int, float]]) -> "FileMetadata":
+        paths, sizes, mtimes = zip(*stats) if stats else ((), (), ())
+        return cls(
+            paths=np.array(paths, dtype=object),
+            sizes=np.array(sizes, dtype=np.int64),
+            mtimes=np.array(mtimes, dtype=np.float64),
+        )
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self.to_records())
+
+    def total_size(self) -> int:
+        return int(self.sizes.sum())
+
+    def max_mtime(self) -> Optional[float]:
+        return float(self.mtimes.max()) if len(self) else None
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        return [
+            {"path": p, "size": int(s), "modified": float(m)}
+            for p, s, m in zip(self.paths, self.sizes, self.mtimes)
+        ]
+
 
 class FileEngine(BaseEngine):
     """Expose one or more data files as a SQL table via DuckDB.
@@ -33,24 +87,77 @@ class FileEngine(BaseEngine):
         self.table = table
         self._duck = DuckDBEngine(database, pool_size=pool_size)
         # Register view pointing to the file path or glob
-        quoted_path = self.path.replace("'", "''")
-        self._duck.run_sql(f"CREATE VIEW {self.table} AS SELECT * FROM '{quoted_path}'")
+        self._duck.run_sql(f"CREATE VIEW {self.table} AS SELECT * FROM {self._source_sql()}")
         self._dialect = self._duck.get_dialect()
-        self.file_metadata = self._collect_metadata()
-
-    def _collect_metadata(self):
-        meta = []
-        for p in glob.glob(self.path):
-            try:
-                st = os.stat(p)
-                meta.append({
-                    "path": os.path.abspath(p),
-                    "size": st.st_size,
-                    "modified": st.st_mtime,
-                })
-            except OSError:
-                continue
-        return meta
+        # Column lists of file-backed views are stable for the engine's life.
+        self._columns: Dict[str, List[str]] = {}
+
+    def _source_sql(self) -> str:
+        """
+        Table function reading ``self.path``.
+
+        Parquet and CSV files use their explicit DuckDB reader.  For those, a
+        glob over file names in one directory is expanded once here and
+        passed as a literal list, so the view does not re-glob the directory
+        on every query.  Patterns with wildcards in the directory part
+        (``**``, hive-partitioned layouts) are left to DuckDB's own globbing,
+        as are other file types, which DuckDB reads from the quoted path.
+        """
+        name = self.path.lower()
+        if name.endswith(_PARQUET_SUFFIXES):
+            return f"read_parquet({self._reader_source()}, union_by_name = false)"
+        if name.endswith(_CSV_SUFFIXES):
+            return f"read_csv_auto({self._reader_source()})"
+        return _sql_literal(self.path)
+
+    def _reader_source(self) -> str:
+        """``self.path`` as a reader argument, file-name globs pre-expanded."""
+        directory, pattern = os.path.split(self.path)
+        if glob.has_magic(pattern) and not glob.has_magic(directory):
+            paths = sorted(self._match_paths())
+            if paths:
+                return "[" + ", ".join(_sql_literal(p) for p in paths) + "]"
+        return _sql_literal(self.path)
+
+    @cached_property
+    def file_metadata(self) -> List[Dict[str, Any]]:
+        """``{"path", "size", "modified"}`` dict for every matched file."""
+        return self.file_metadata_arrays.to_records()
+
+    @cached_property
+    def file_metadata_arrays(self) -> FileMetadata:
+        """Path, size and mtime arrays of every matched file (collected on
+        first use)."""
+        return self._collect_metadata()
+
+    def _collect_metadata(self) -> FileMetadata:
+        paths = self._match_paths()
+        if len(paths) > _PARALLEL_STAT_THRESHOLD:
+            workers = min(32, (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                stats = list(pool.map(_stat_entry, paths))
+        else:
+            stats = [_stat_entry(p) for p in paths]
+        return FileMetadata.from_stats([m for m in stats if m is not None])
+
+    def _match_paths(self) -> List[str]:
+        """Expand ``self.path`` like :func:`glob.glob` (``**`` recursing, as
+        in DuckDB), scanning one directory when only the file name contains
+        wildcards."""
+        directory, pattern = os.path.split(self.path)
+        if not glob.has_magic(pattern) or glob.has_magic(directory):
+            return glob.glob(self.path, recursive=True)
+        include_hidden = pattern.startswith(".")
+        try:
+            with os.scandir(directory or os.curdir) as it:
+                return [
+                    os.path.join(directory, entry.name)
+                    for entry in it
+                    if (include_hidden or not entry.name.startswith("."))
+                    and fnmatch.fnmatch(entry.name, pattern)
+                ]
+        except OSError:
+            return []
 
     # ------------------------------------------------------------------ #
     # BaseEngine interface                                               #
@@ -61,13 +168,28 @@ class FileEngine(BaseEngine):
     def run_many(self, sql_statements: Sequence[str | exp.Expression]):
         return self._duck.run_many(sql_statements)
 
+    def run_sql_arrow(self, sql: str | exp.Expression) -> "pa.Table":
+        """Arrow-native variant of :py:meth:`run_sql`; requires ``pyarrow``."""
+        return self._duck.run_sql_arrow(sql)
+
     def list_columns(self, table: str) -> List[str]:
-        return self._duck.list_columns(table)
+        cols = self._columns.get(table)
+        if cols is None:
+            cols = self._columns[table] = self._duck.list_columns(table)
+        return list(cols)
+
+    def invalidate_columns(self, table: Optional[str] = None) -> None:
+        """Forget cached column lists for *table* (or all tables)."""
+        if table is None:
+            self._columns.clear()
+        else:
+            self._columns.pop(table, None)
 
     def get_dialect(self) -> str:
         return self._dialect
 
     def close(self) -> None:
+        self._columns.clear()
         with contextlib.suppress(Exception):
             self._duck.run_sql(f"DROP VIEW IF EXISTS {self.table}")
         self._duck.close()
@@ -77,3 +199,16 @@ class FileEngine(BaseEngine):
     # ------------------------------------------------------------------ #
     def __repr__(self) -> str:  # pragma: no cover
         return f"<FileEngine path={self.path!r} table={self.table!r}>"
+
+
+def _stat_entry(path: str) -> Optional[Tuple[str, int, float]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return os.path.abspath(path), st.st_size, st.st_mtime
+
+
+def _sql_literal(value: str) -> str:
+    escaped = value.replace("'", "''")
+    return f"'{escaped}'"
@@ -9,15 +9,26 @@ compilation is delegated to sqlglot.
 
 from __future__ import annotations
 
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Optional, Sequence
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
 from sqlglot import exp, select
 
 from src.expectations.errors import ValidationConfigError
 from src.expectations.metrics.utils import validate_filter_sql
 
-from src.expectations.metrics.registry import get_metric, available_metrics
+from src.expectations.metrics.registry import (
+    MetricRegistry,
+    available_metrics,
+    build_metric,
+    get_metric,
+)
+
+__all__ = ["MetricRequest", "MetricBatchBuilder"]
 
 
 # --------------------------------------------------------------------------- #
@@ -30,12 +41,193 @@ class MetricRequest:
     alias: str
     filter_sql: Optional[str] = None  # optional per-metric WHERE
 
+    def __post_init__(self) -> None:
+        if self.metric not in _known_metrics():
+            raise ValueError(f"Unknown metric: {self.metric}")
+
+
+# --------------------------------------------------------------------------- #
+# Compiled SQL cache                                                          #
+# --------------------------------------------------------------------------- #
+# (table, dialect, registry version, requests) -> SQL text.  The registry
+# version keeps entries from outliving a metric re-registration.
+_SQL_CACHE: Dict[Tuple, str] = {}
+_SQL_CACHE_MAX = 1024
+_SQL_CACHE_LOCK = threading.Lock()
+
+
+def clear_sql_cache() -> None:
+    """Drop every cached batch SQL string (mainly for tests)."""
+    with _SQL_CACHE_LOCK:
+        _SQL_CACHE.clear()
+
+
+# (registry version, known metric keys) – rebuilt only after a registration.
+_KNOWN_METRICS: Tuple[int, frozenset[str]] = (-1, frozenset())
+
+
+def _known_metrics() -> frozenset[str]:
+    global _KNOWN_METRICS
+    version, names = _KNOWN_METRICS
+    current = MetricRegistry.instance().version
+    if version != current:
+        names = frozenset(available_metrics())
+        _KNOWN_METRICS = (current, names)
+    return names
+
+
+# --------------------------------------------------------------------------- #
+# Metric templates                                                            #
+# --------------------------------------------------------------------------- #
+_PLACEHOLDER = "__col__"
+_PROBE = "__probe__"
+
+
+def _bind_column(template: exp.Expression, column: str) -> exp.Expression:
+    """Copy *template* with every placeholder column replaced by *column*."""
+    return template.copy().transform(
+        lambda n: exp.column(column)
+        if isinstance(n, exp.Column) and n.name == _PLACEHOLDER and not n.table
+        else n,
+        copy=False,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _metric_template(metric: str, version: int) -> Optional[exp.Expression]:
+    """
+    Build *metric* once against a placeholder column.
+
+    Returns ``None`` for builders that use the column name in any way other
+    than a plain column reference (those are called per request instead).
+    """
+    builder = get_metric(metric)
+    template = builder(_PLACEHOLDER)
+    if _bind_column(template, _PROBE) != builder(_PROBE):
+        return None
+    return template
+
+
+@functools.lru_cache(maxsize=None)
+def _template_sql(metric: str, dialect: str, version: int) -> Optional[str]:
+    """Dialect SQL of the metric template, or ``None`` if not templated."""
+    template = _metric_template(metric, version)
+    if template is None:
+        return None
+    return template.sql(dialect=dialect, pretty=False)
+
+
+@functools.lru_cache(maxsize=4096)
+def _column_sql(column: str, dialect: str) -> str:
+    return exp.column(column).sql(dialect=dialect)
+
+
+@functools.lru_cache(maxsize=4096)
+def _identifier_sql(name: str, dialect: str) -> str:
+    return exp.to_identifier(name).sql(dialect=dialect)
+
+
+@functools.lru_cache(maxsize=1024)
+def _from_sql(table: str, dialect: str) -> str:
+    return select(exp.Star()).from_(table).args["from_"].sql(dialect=dialect)
+
+
+# --------------------------------------------------------------------------- #
+# Filter wrappers                                                             #
+# --------------------------------------------------------------------------- #
+def _case_when(condition: exp.Expression, then: exp.Expression) -> exp.Case:
+    """``CASE WHEN condition THEN then END`` built directly (no copies).
+
+    Both arguments are adopted as-is, so callers pass nodes they own.
+    """
+    return exp.Case(ifs=[exp.If(this=condition, true=then)])
+
+
+def _wrap_count(expr: exp.Count, filter_exp: exp.Expression) -> exp.Expression:
+    """COUNT aggregates have several special cases."""
+    arg = expr.args.get("this")
+
+    # COUNT(DISTINCT col) -> COUNT(DISTINCT CASE WHEN cond THEN col END)
+    if isinstance(arg, exp.Distinct):
+        expr = expr.copy()
+        distinct = expr.this
+        distinct.set(
+            "expressions",
+            [_case_when(filter_exp.copy(), e) for e in distinct.expressions],
+        )
+        return expr
+
+    # COUNT(CASE WHEN col IS NULL THEN NULL ELSE 1 END)
+    if isinstance(arg, exp.Case):
+        # Detect a simple non-null counting CASE expression
+        if (
+            len(arg.args.get("ifs", [])) == 1
+            and isinstance(arg.args["ifs"][0], exp.If)
+            and isinstance(arg.args["ifs"][0].this, exp.Is)
+            and isinstance(arg.args["ifs"][0].this.expression, exp.Null)
+            and isinstance(arg.args["ifs"][0].args.get("true"), exp.Null)
+            and isinstance(arg.args.get("default"), exp.Literal)
+            and not arg.args["default"].is_string
+            and arg.args["default"].this == "1"
+        ):
+            not_null_cond = exp.Not(this=arg.args["ifs"][0].this.copy())
+            # and_ parenthesises OR-filters, so keep it for the conjunction
+            condition = exp.and_(filter_exp.copy(), not_null_cond, copy=False)
+            return exp.Count(this=_case_when(condition, exp.Literal.number(1)))
+
+        # Otherwise, wrap entire CASE in another conditional
+        return exp.Count(this=_case_when(filter_exp.copy(), arg.copy()))
+
+    # COUNT(*) or COUNT(col) → SUM(CASE WHEN condition THEN 1 END)
+    return exp.Sum(this=_case_when(filter_exp.copy(), exp.Literal.number(1)))
+
+
+def _wrap_aggregate_arg(expr: exp.Expression, filter_exp: exp.Expression) -> exp.Expression:
+    """MIN/MAX/AVG/STDDEV → aggregate(CASE WHEN condition THEN arg END)"""
+    expr = expr.copy()
+    expr.set("this", _case_when(filter_exp.copy(), expr.this))
+    return expr
+
+
+def _wrap_sum_fallback(expr: exp.Expression, filter_exp: exp.Expression) -> exp.Expression:
+    """Fallback: wrap entire expression in SUM(CASE WHEN … END)"""
+    return exp.Sum(this=_case_when(filter_exp.copy(), expr.copy()))
+
+
+_FilterWrapper = Callable[[exp.Expression, exp.Expression], exp.Expression]
+
+_FILTER_WRAPPERS: Dict[type, _FilterWrapper] = {
+    exp.Count: _wrap_count,
+    exp.Min: _wrap_aggregate_arg,
+    exp.Max: _wrap_aggregate_arg,
+    exp.Avg: _wrap_aggregate_arg,
+    exp.Stddev: _wrap_aggregate_arg,
+    exp.StddevSamp: _wrap_aggregate_arg,
+    exp.StddevPop: _wrap_aggregate_arg,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _filter_wrapper(node_type: type) -> _FilterWrapper:
+    """Wrapper for *node_type*, honouring subclasses of the mapped types."""
+    for klass in node_type.__mro__:
+        wrapper = _FILTER_WRAPPERS.get(klass)
+        if wrapper is not None:
+            return wrapper
+    return _wrap_sum_fallback
+
 
 # --------------------------------------------------------------------------- #
 # Batch builder                                                               #
 # --------------------------------------------------------------------------- #
 class MetricBatchBuilder:
-    """Convert many :class:`MetricRequest` objects into a single query."""
+    """Convert many :class:`MetricRequest` objects into a single query.
+
+    Planning never touches an engine and all shared caches are thread-safe,
+    so builders may be planned concurrently (see :py:meth:`plan_many`).
+    """
+
+    __slots__ = ("table", "requests", "dialect")
 
     def __init__(
         self,
@@ -45,13 +237,20 @@ class MetricBatchBuilder:
         dialect: str = "ansi",
     ):
         self.table = table
-        self.requests = list(requests)
+        self.requests: Tuple[MetricRequest, ...] = tuple(requests)
         self.dialect = dialect
 
-        known = set(available_metrics())
-        unknown = {r.metric for r in self.requests if r.metric not in known}
-        if unknown:
-            raise ValueError(f"Unknown metrics: {', '.join(sorted(unknown))}")
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, MetricBatchBuilder):
+            return NotImplemented
+        return (self.table, self.dialect, self.requests) == (
+            other.table,
+            other.dialect,
+            other.requests,
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.table, self.dialect, self.requests))
 
     # ------------------------------------------------------------------ #
     # Private helpers                                                    #
@@ -63,85 +262,133 @@ class MetricBatchBuilder:
         if not filter_sql:
             return expr
 
-        filter_exp = validate_filter_sql(filter_sql)
-
-        # COUNT aggregates have several special cases
-        if isinstance(expr, exp.Count):
-            arg = expr.args.get("this")
-
-            # COUNT(DISTINCT col) -> COUNT(DISTINCT CASE WHEN cond THEN col END)
-            if isinstance(arg, exp.Distinct):
-                new_distinct = arg.copy()
-                new_exprs = [
-                    exp.Case().when(filter_exp, e) for e in arg.expressions
-                ]
-                new_distinct.set("expressions", new_exprs)
-                expr = expr.copy()
-                expr.set("this", new_distinct)
-                return expr
-
-            # COUNT(CASE WHEN col IS NULL THEN NULL ELSE 1 END)
-            if isinstance(arg, exp.Case):
-                # Detect a simple non-null counting CASE expression
-                if (
-                    len(arg.args.get("ifs", [])) == 1
-                    and isinstance(arg.args["ifs"][0], exp.If)
-                    and isinstance(arg.args["ifs"][0].this, exp.Is)
-                    and isinstance(arg.args["ifs"][0].this.expression, exp.Null)
-                    and isinstance(arg.args["ifs"][0].args.get("true"), exp.Null)
-                    and isinstance(arg.args.get("default"), exp.Literal)
-                    and not arg.args["default"].is_string
-                    and arg.args["default"].this == "1"
-                ):
-                    not_null_cond = exp.Not(this=arg.args["ifs"][0].this)
-                    condition = exp.and_(filter_exp, not_null_cond)
-                    case_expr = exp.Case().when(condition, exp.Literal.number(1))
-                    return exp.Count(this=case_expr)
-
-                # Otherwise, wrap entire CASE in another conditional
-                wrapped_case = exp.Case().when(filter_exp, arg.copy())
-                return exp.Count(this=wrapped_case)
-
-            # COUNT(*) or COUNT(col) → SUM(CASE WHEN condition THEN 1 END)
-            case_expr = exp.Case().when(filter_exp, exp.Literal.number(1))
-            return exp.Sum(this=case_expr)
-
-        # MIN/MAX/AVG/STDDEV → aggregate(CASE WHEN condition THEN arg END)
-        if isinstance(
-            expr,
-            (
-                exp.Min,
-                exp.Max,
-                exp.Avg,
-                exp.Stddev,
-                exp.StddevSamp,
-                exp.StddevPop,
-            ),
-        ):
-            new_arg = (
-                exp.Case()
-                .when(filter_exp, expr.args.get("this"))
-            )
-            expr = expr.copy()
-            expr.set("this", new_arg)
+        return MetricBatchBuilder._apply_parsed_filter(
+            expr, validate_filter_sql(filter_sql)
+        )
+
+    @staticmethod
+    def _apply_parsed_filter(
+        expr: exp.Expression, filter_exp: Optional[exp.Expression]
+    ) -> exp.Expression:
+        if filter_exp is None:
             return expr
+        return _filter_wrapper(type(expr))(expr, filter_exp)
 
-        # Fallback: wrap entire expression in SUM(CASE WHEN … END)
-        return exp.Sum(
-            this=exp.Case().when(filter_exp, expr.copy())
-        )
+    def _parsed_filters(self) -> Dict[str, exp.Expression]:
+        """Validate each distinct ``filter_sql`` in the batch exactly once."""
+        return {
+            fs: validate_filter_sql(fs)
+            for fs in dict.fromkeys(r.filter_sql for r in self.requests if r.filter_sql)
+        }
+
+    def _render(self, version: int) -> str:
+        """
+        Assemble the SELECT text directly from pre-compiled metric templates.
+
+        Only filtered or non-templated metrics are rendered through an AST;
+        the output matches ``build_query_ast().sql(dialect=...)``.
+        """
+        # Build the AST-rendered projections first so filter errors surface
+        # before any dialect lookup, exactly as with build_query_ast().
+        filters = self._parsed_filters()
+        pending: List[exp.Expression | MetricRequest] = []
+        for req in self.requests:
+            if req.filter_sql or _metric_template(req.metric, version) is None:
+                raw_expr = build_metric(req.metric, req.column)
+                final_expr = self._apply_parsed_filter(raw_expr, filters.get(req.filter_sql))
+                pending.append(exp.alias_(final_expr, req.alias))
+            else:
+                pending.append(req)
+
+        dialect = self.dialect
+        placeholder = _column_sql(_PLACEHOLDER, dialect)
+        parts: List[str] = []
+        append = parts.append
+        for item in pending:
+            if isinstance(item, exp.Expression):
+                append(item.sql(dialect=dialect))
+                continue
+            tpl_sql = _template_sql(item.metric, dialect, version)
+            column_sql = _column_sql(item.column, dialect)
+            alias_sql = _identifier_sql(item.alias, dialect)
+            append(f"{tpl_sql.replace(placeholder, column_sql)} AS {alias_sql}")
+
+        return f"SELECT {', '.join(parts)} {_from_sql(self.table, dialect)}"
 
     # ------------------------------------------------------------------ #
     # Public API                                                         #
     # ------------------------------------------------------------------ #
     def build_query_ast(self) -> exp.Expression:
+        filters = self._parsed_filters()
         projections: List[exp.Expression] = []
+        version = MetricRegistry.instance().version
         for req in self.requests:
-            raw_expr = get_metric(req.metric)(req.column).copy()
-            final_expr = self._apply_filter(raw_expr, req.filter_sql)
+            template = _metric_template(req.metric, version)
+            if template is None:
+                raw_expr = build_metric(req.metric, req.column)
+            else:
+                raw_expr = _bind_column(template, req.column)
+            final_expr = self._apply_parsed_filter(raw_expr, filters.get(req.filter_sql))
             projections.append(exp.alias_(final_expr, req.alias))
 
         return select(*projections).from_(self.table)
 
+    @classmethod
+    def plan_many(
+        cls,
+        specs: Sequence[Tuple[str, Sequence[MetricRequest], str]],
+        *,
+        max_workers: Optional[int] = None,
+    ) -> List[str]:
+        """
+        Compile one SQL string per ``(table, requests, dialect)`` spec.
+
+        Specs are planned on a thread pool so planning can overlap with
+        queries already running elsewhere; results keep the input order.
+        """
+        def _plan(spec: Tuple[str, Sequence[MetricRequest], str]) -> str:
+            table, requests, dialect = spec
+            return cls(table=table, requests=requests, dialect=dialect).sql()
+
+        if len(specs) <= 1:
+            return [_plan(spec) for spec in specs]
+        workers = max_workers or min(len(specs), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(_plan, specs))
+
+    def union(self, others: Sequence["MetricBatchBuilder"]) -> str:
+        """
+        Fuse this batch with *others* into one query returning a single row.
+
+        Each batch becomes a one-row subquery and the subqueries are
+        ``CROSS JOIN``-ed, so the engine evaluates every batch in a single
+        round-trip.  Aliases must be unique across all batches.
+        """
+        builders = [self, *others]
+        if any(b.dialect != self.dialect for b in builders):
+            raise ValueError("Cannot union metric batches with different dialects")
+        aliases = [r.alias for b in builders for r in b.requests]
+        if len(aliases) != len(set(aliases)):
+            raise ValueError("Metric aliases must be unique across unioned batches")
+        if not others:
+            return self.sql()
+        subqueries = [f"({b.sql()}) AS b{i}" for i, b in enumerate(builders)]
+        return "SELECT * FROM " + " CROSS JOIN ".join(subqueries)
+
     def sql(self) -> str:
-        return self.build_query_ast().sql(dialect=self.dialect, pretty=False)
+        key = (
+            self.table,
+            self.dialect,
+            MetricRegistry.instance().version,
+            self.requests,
+        )
+        cached = _SQL_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+        sql = self._render(key[2])
+        with _SQL_CACHE_LOCK:
+            if len(_SQL_CACHE) >= _SQL_CACHE_MAX:
+                _SQL_CACHE.clear()
+            _SQL_CACHE[key] = sql
+        return sql
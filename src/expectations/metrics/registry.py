@@ -21,8 +21,11 @@ key           | meaning                               | expression
 
 from __future__ import annotations
 
+import functools
+import sys
 import threading
-from typing import Callable, Dict, Tuple
+from types import MappingProxyType
+from typing import Callable, Dict, Mapping, Optional, Tuple
 
 from sqlglot import exp
 from src.expectations.metrics.utils import validate_filter_sql
@@ -34,64 +37,146 @@ MetricBuilder = Callable[[str], exp.Expression]
 
 
 class MetricRegistry:
-    """Thread-safe singleton registry of metric builders."""
+    """Thread-safe singleton registry of metric builders.
 
-    _instance: "MetricRegistry | None" = None
-    _instance_lock = threading.RLock()
+    Registrations replace the internal dict under a lock; lookups read the
+    current dict without locking.
+    """
+
+    __slots__ = ("_metrics", "_lock", "_version", "_pct_predicates")
 
     def __init__(self) -> None:
         self._metrics: Dict[str, MetricBuilder] = {}
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()  # serialises writers only
+        # Bumped on every registration so callers can key caches on it.
+        self._version = 0
+        # name -> predicate SQL for metrics added by register_pct_where.
+        self._pct_predicates: Dict[str, str] = {}
 
     @classmethod
     def instance(cls) -> "MetricRegistry":
-        if cls._instance is None:
-            with cls._instance_lock:
-                if cls._instance is None:
-                    cls._instance = cls()
-        return cls._instance
+        """Return the process-wide registry, created when this module loads."""
+        return _REGISTRY
 
     # ------------------------------------------------------------------ #
     # Public API                                                        #
     # ------------------------------------------------------------------ #
     def register(self, name: str, builder: MetricBuilder) -> None:
+        # Copy-on-write: readers only ever see a fully built dict, so they
+        # need no lock.
+        # Interned keys let lookups with literal names hit the identity check.
+        name = sys.intern(name)
         with self._lock:
-            if name in self._metrics:
-                raise KeyError(f"Metric key '{name}' already registered")
-            self._metrics[name] = builder
+            self._insert(name, builder)
 
-    def get(self, name: str) -> MetricBuilder:
+    def register_pct_where(self, name: str, predicate_sql: str) -> MetricBuilder:
+        """Register ``pct_where(predicate_sql)`` under *name* unless the same
+        predicate is already registered there; return the registered builder.
+        """
+        name = sys.intern(name)
+        with self._lock:
+            existing = self._metrics.get(name)
+            if existing is not None and self._pct_predicates.get(name) == predicate_sql:
+                return existing
+            builder = pct_where(predicate_sql)
+            self._insert(name, builder)
+            self._pct_predicates[name] = predicate_sql
+            return builder
+
+    def unregister(self, name: str) -> None:
+        """Remove *name*; raises ``KeyError`` if it is not registered."""
         with self._lock:
-            try:
-                return self._metrics[name]
-            except KeyError as exc:  # pragma: no cover
-                raise KeyError(
-                    f"Unknown metric key '{name}'. Available: {', '.join(sorted(self._metrics))}"
-                ) from exc
+            if name not in self._metrics:
+                raise KeyError(f"Unknown metric key '{name}'")
+            metrics = dict(self._metrics)
+            del metrics[name]
+            self._metrics = metrics
+            self._pct_predicates.pop(name, None)
+            self._version += 1
+
+    def _insert(self, name: str, builder: MetricBuilder) -> None:
+        # Caller holds ``self._lock``.
+        if name in self._metrics:
+            raise KeyError(f"Metric key '{name}' already registered")
+        metrics = dict(self._metrics)
+        metrics[name] = builder
+        self._metrics = metrics
+        self._version += 1
+
+    def get(self, name: str) -> MetricBuilder:
+        metrics = self._metrics
+        try:
+            return metrics[name]
+        except KeyError as exc:  # pragma: no cover
+            raise KeyError(
+                f"Unknown metric key '{name}'. Available: {', '.join(sorted(metrics))}"
+            ) from exc
+
+    def get_or_none(self, name: str) -> Optional[MetricBuilder]:
+        """Like :py:meth:`get` but returns ``None`` for unknown keys."""
+        return self._metrics.get(name)
 
     def keys(self) -> Tuple[str, ...]:
-        with self._lock:
-            return tuple(self._metrics)
+        return tuple(self._metrics)
+
+    def snapshot(self) -> Mapping[str, MetricBuilder]:
+        """Read-only view of the current name -> builder map.
+
+        Later registrations publish a new map and do not show up in an
+        existing snapshot; take a fresh one after registering.
+        """
+        return MappingProxyType(self._metrics)
+
+    @property
+    def version(self) -> int:
+        """Registration counter; changes whenever a metric is added."""
+        return self._version
 
 
 # --------------------------------------------------------------------------- #
 # Helper functions wrapping the singleton                                      #
 # --------------------------------------------------------------------------- #
+# Eager singleton: module import is already serialised by the import lock.
+_REGISTRY = MetricRegistry()
+
+
 def register_metric(name: str) -> Callable[[MetricBuilder], MetricBuilder]:
     def _decorator(fn: MetricBuilder) -> MetricBuilder:
-        MetricRegistry.instance().register(name, fn)
+        _REGISTRY.register(name, fn)
         return fn
 
     return _decorator
 
 
-def get_metric(name: str) -> MetricBuilder:
-    return MetricRegistry.instance().get(name)
+def unregister_metric(name: str) -> None:
+    """Remove a registered metric (mainly for test clean-up)."""
+    _REGISTRY.unregister(name)
+
+
+# Bound methods of the singleton, so a lookup is a single dict access with
+# no wrapper frame.  ``get_metric`` raises KeyError for unknown keys;
+# ``available_metrics`` returns a **tuple** of the registered keys.
+get_metric: Callable[[str], MetricBuilder] = _REGISTRY.get
+available_metrics: Callable[[], Tuple[str, ...]] = _REGISTRY.keys
 
 
-def available_metrics() -> Tuple[str, ...]:
-    """Return a **tuple** of all registered metric keys (read-only)."""
-    return MetricRegistry.instance().keys()
+def metrics_snapshot() -> Mapping[str, MetricBuilder]:
+    """Read-only name -> builder map for tight lookup loops."""
+    return _REGISTRY.snapshot()
+
+
+def build_metric(name: str, column: str) -> exp.Expression:
+    """Return ``get_metric(name)(column)``, memoised per *(name, column)*.
+
+    Each call returns a fresh copy, so callers may mutate the tree.
+    """
+    return _build_cached(name, column, _REGISTRY.version).copy()
+
+
+@functools.lru_cache(maxsize=2048)
+def _build_cached(name: str, column: str, version: int) -> exp.Expression:
+    # ``version`` keys entries to the registry state they were built from.
+    return get_metric(name)(column)
 
 
 # ------------------------------------------------------------------ #
@@ -164,18 +249,37 @@ def _stddev(column: str) -> exp.Expression:
     return exp.StddevSamp(this=exp.column(column))
 
 
+@functools.lru_cache(maxsize=512)
 def pct_where(predicate_sql: str) -> MetricBuilder:
-    """Return a metric builder for ``pct_where`` using *predicate_sql*."""
+    """Return a metric builder for ``pct_where`` using *predicate_sql*.
+
+    Memoised: the same predicate always yields the same builder instance.
+
+    The predicate is validated here, once; invalid SQL raises
+    :class:`ValidationConfigError` immediately.
+    """
+    condition_template = validate_filter_sql(predicate_sql)
 
     def _builder(_: str) -> exp.Expression:
-        condition = validate_filter_sql(predicate_sql)
+        # Fresh copy per call: sqlglot nodes carry parent pointers.
+        condition = condition_template.copy()
         case_expr = (
             exp.Case()
-            .when(condition, exp.Literal.number(1))
-            .else_(exp.Literal.number(0))
+            .when(condition, exp.Literal.number(1), copy=False)
+            .else_(exp.Literal.number(0), copy=False)
         )
         sum_true = exp.Sum(this=case_expr)
         count_rows = exp.Count(this=exp.Star())
         return exp.Div(this=sum_true, expression=count_rows)
 
     return _builder
+
+
+def register_pct_where(name: str, predicate_sql: str) -> MetricBuilder:
+    """Register ``pct_where(predicate_sql)`` under *name* and return it.
+
+    Idempotent: registering the same name and predicate again returns the
+    existing builder, even once :func:`pct_where` has evicted it.  *name*
+    bound to any other predicate or metric raises ``KeyError``.
+    """
+    return _REGISTRY.register_pct_where(name, predicate_sql)
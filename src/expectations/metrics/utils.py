@@ -1,7 +1,11 @@
 # src/expectations/metrics/utils.py
 from __future__ import annotations
 
+import functools
+import re
+
 from sqlglot import exp, parse_one, ParseError
+from sqlglot.tokens import Tokenizer
 from src.expectations.errors import ValidationConfigError
 
 # ------------------------------------------------------------------ #
@@ -36,6 +40,54 @@ def _is_boolean(expr: exp.Expression) -> bool:
     flag = getattr(expr, "is_boolean", None)
     return flag if flag is not None else isinstance(expr, _FALLBACK_BOOLEAN_NODES)
 
+# ------------------------------------------------------------------ #
+#   Fast path for ``col OP literal`` / ``col IS [NOT] NULL``         #
+# ------------------------------------------------------------------ #
+_COMPARISON = re.compile(
+    r"^\s*([A-Za-z_][A-Za-z0-9_]*)\s*(=|!=|<>|<=|>=|<|>)\s*"
+    r"(?:'((?:[^'\\]|'')*)'|(-?)(\d+(?:\.\d+)?)|(NULL))\s*$",
+    re.IGNORECASE,
+)
+_IS_NULL = re.compile(
+    r"^\s*([A-Za-z_][A-Za-z0-9_]*)\s+IS\s+(NOT\s+)?NULL\s*$", re.IGNORECASE
+)
+_COMPARISON_NODES = {
+    "=": exp.EQ, "!=": exp.NEQ, "<>": exp.NEQ,
+    "<": exp.LT, "<=": exp.LTE, ">": exp.GT, ">=": exp.GTE,
+}
+
+
+def _fast_predicate(sql: str) -> exp.Expression | None:
+    """
+    Build the AST of a trivial predicate without running the parser.
+
+    Returns exactly what :func:`parse_one` would, or ``None`` when *sql* is
+    not one of the simple shapes (or names a keyword) and needs a full parse.
+    """
+    if m := _COMPARISON.match(sql):
+        name, op, string, sign, number, null = m.groups()
+        if name.upper() in Tokenizer.KEYWORDS:
+            return None
+        if string is not None:
+            value: exp.Expression = exp.Literal.string(string.replace("''", "'"))
+        elif number is not None:
+            value = exp.Literal.number(number)
+            if sign:
+                value = exp.Neg(this=value)
+        else:
+            value = exp.Null()
+        return _COMPARISON_NODES[op](this=exp.column(name), expression=value)
+
+    if m := _IS_NULL.match(sql):
+        name, negated = m.groups()
+        if name.upper() in Tokenizer.KEYWORDS:
+            return None
+        node: exp.Expression = exp.Is(this=exp.column(name), expression=exp.Null())
+        return exp.Not(this=node) if negated else node
+
+    return None
+
+
 # ------------------------------------------------------------------ #
 #   Public validator                                              #
 # ------------------------------------------------------------------ #
@@ -43,19 +95,29 @@ def validate_filter_sql(sql: str) -> exp.Expression:
     """
     Ensure *sql* is a safe, BOOLEAN-returning WHERE predicate.
 
-    Raises ValidationConfigError on any problem.
+    Raises ValidationConfigError on any problem.  Results are memoised on the
+    filter text; each call returns a fresh copy the caller may mutate.
     """
+    return _validated_filter(sql).copy()
+
+
+@functools.lru_cache(maxsize=512)
+def _validated_filter(sql: str) -> exp.Expression:
+    # No multi-statement delimiters (cheap, so checked before any parsing)
+    if ";" in sql:
+        raise ValidationConfigError("Semicolons are not allowed in filter clauses")
+
+    fast = _fast_predicate(sql)
+    if fast is not None:
+        return fast
+
     try:
         tree = parse_one(sql, error_level="raise")
     except ParseError as exc:
         raise ValidationConfigError(f"Invalid filter SQL: {exc}") from exc
 
-    # No multi-statement delimiters
-    if ";" in sql:
-        raise ValidationConfigError("Semicolons are not allowed in filter clauses")
-
     # Disallow any DDL / DML constructs present in this sqlglot build
-    if any(isinstance(node, _BAD_NODE_TYPES) for node in tree.walk()):
+    if tree.find(*_BAD_NODE_TYPES) is not None:
         raise ValidationConfigError("Filter contains disallowed SQL constructs")
 
     # Must be a boolean predicate
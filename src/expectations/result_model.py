@@ -7,20 +7,25 @@ Typed artefacts passed from runner to downstream stores / reporters.
 
 from __future__ import annotations
 
-import uuid
-from datetime import datetime
+import os
+from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
 from pydantic import BaseModel, Field
 
 
+def utcnow() -> datetime:
+    """Naive UTC *now*; drop-in for the deprecated ``datetime.utcnow()``."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 class RunMetadata(BaseModel):
-    run_id: str = Field(default_factory=lambda: uuid.uuid4().hex)
+    run_id: str = Field(default_factory=lambda: os.urandom(16).hex())
     suite_name: str
     sla_name: Optional[str] = None
     engine_name: Optional[str] = None
     db_schema: Optional[str] = None
-    started_at: datetime = Field(default_factory=datetime.utcnow)
+    started_at: datetime = Field(default_factory=utcnow)
     finished_at: Optional[datetime] = None
 
     # ------------------------------------------------------------------
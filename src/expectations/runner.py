@@ -8,7 +8,8 @@ Single entry-point that executes both *metric* and *custom* validators.
 from __future__ import annotations
 
 from collections import defaultdict
-from typing import Dict, List, Sequence, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
 
 import duckdb
 import traceback
@@ -17,10 +18,14 @@ import pandas as pd
 from sqlglot import exp
 
 from src.expectations.engines.base import BaseEngine
-from src.expectations.metrics.batch_builder import MetricBatchBuilder
+from src.expectations.metrics.batch_builder import MetricBatchBuilder, clear_sql_cache
 from src.expectations.result_model import ValidationResult, RunMetadata
+from src.expectations.utils import first_row
 from src.expectations.validators.base import ValidatorBase
 
+if TYPE_CHECKING:  # pragma: no cover
+    from src.expectations.stats import MetricStat, TableStatsCollector
+
 # --------------------------------------------------------------------------- #
 # Helper dataclass                                                            #
 # --------------------------------------------------------------------------- #
@@ -31,13 +36,65 @@ ValidatorBinding = Tuple[str, str, ValidatorBase]  # (engine_key, table, validat
 # Runner                                                                      #
 # --------------------------------------------------------------------------- #
 class ValidationRunner:
-    def __init__(self, engine_map: Dict[str, BaseEngine]):
+    """
+    Parameters
+    ----------
+    engine_map : dict[str, BaseEngine]
+        Engines keyed by the ``engine_key`` used in bindings.
+    max_workers : int, optional
+        Opt-in concurrency: with ``max_workers > 1`` and bindings spanning
+        several engines, each engine's work runs on its own pool thread.
+        Engines must then be usable from a non-creating thread – a
+        :class:`DuckDBEngine` with ``pool_size > 1`` switches to a per-thread
+        cursor there, which does not see TEMP tables or ``SET``/``USE`` state
+        of its main connection.  By default everything runs on the calling
+        thread.
+    """
+
+    def __init__(self, engine_map: Dict[str, BaseEngine], *, max_workers: Optional[int] = None):
         self.engine_map = engine_map
+        self.max_workers = max_workers
 
     # ------------------------------------------------------------------ #
     # Public API                                                         #
     # ------------------------------------------------------------------ #
+    @staticmethod
+    def clear_sql_cache() -> None:
+        """Forget batch SQL compiled by earlier runs.
+
+        Batch SQL is cached on ``(table, dialect, requests)``, so re-running
+        the same bindings skips query planning entirely.
+        """
+        clear_sql_cache()
+
     def run(self, bindings: Sequence[ValidatorBinding], *, run_id: str) -> List[ValidationResult]:
+        return self._run(bindings, run_id=run_id)[0]
+
+    def run_with_stats(
+        self,
+        bindings: Sequence[ValidatorBinding],
+        collector: "TableStatsCollector",
+        *,
+        run_id: str,
+    ) -> Tuple[List[ValidationResult], List["MetricStat"]]:
+        """
+        Run *bindings* and collect *collector*'s statistics for every bound
+        table in the same queries.
+
+        The statistics requests ride along in each table's metric batch, so
+        validation and profiling share one round-trip instead of two.  Tables
+        whose batch query fails yield failed results and no statistics.
+        """
+        return self._run(bindings, run_id=run_id, collector=collector)
+
+    def _run(
+        self,
+        bindings: Sequence[ValidatorBinding],
+        *,
+        run_id: str,
+        collector: Optional["TableStatsCollector"] = None,
+    ) -> Tuple[List[ValidationResult], List["MetricStat"]]:
+        # (engine_key, table) -> metric validators, in first-appearance order.
         metric_groups: Dict[Tuple[str, str], List[ValidatorBase]] = defaultdict(list)
         custom_bindings: List[ValidatorBinding] = []
 
@@ -49,89 +106,210 @@ class ValidationRunner:
                 metric_groups[(eng_key, table)].append(v)
             else:
                 custom_bindings.append((eng_key, table, v))
+                if collector is not None:
+                    # Statistics still need a batch for this table.
+                    metric_groups.setdefault((eng_key, table), [])
 
-        results: List[ValidationResult] = []
-
-        # -- metric validators (batched) --------------------------------
+        # One task per engine *object*: keys sharing an engine never run on
+        # two threads at once.
+        engines: Dict[int, BaseEngine] = {}
+        metric_work: Dict[int, List[Tuple[str, str, List[ValidatorBase]]]] = defaultdict(list)
+        custom_work: Dict[int, List[Tuple[int, str, ValidatorBase]]] = defaultdict(list)
         for (eng_key, table), validators in metric_groups.items():
             engine = self.engine_map[eng_key]
-            requests = [v.metric_request() for v in validators]
-            sql = MetricBatchBuilder(
-                table=table,
-                requests=requests,
-                dialect=engine.get_dialect(),
-            ).sql()
-            try:
-                df: pd.DataFrame = engine.run_sql(sql)
-                row = df.iloc[0]
-                for v in validators:
-                    val = row[v.runtime_id]
-                    ok = v.interpret(val)
-                    results.append(
-                        ValidationResult(
-                            run_id=run_id,
-                            validator=v.__class__.__name__,
-                            table=table,
-                            column=getattr(v, "column", None),
-                            metric=v.metric_request().metric,
-                            success=ok,
-                            value=val,
-                            filter_sql=v.where_condition,
-                        )
-                    )
-            except (duckdb.Error, ValueError, RuntimeError) as exc:
-                tb = traceback.format_exc()
-                for v in validators:
-                    results.append(
-                        ValidationResult(
-                            run_id=run_id,
-                            validator=v.__class__.__name__,
-                            table=table,
-                            column=getattr(v, "column", None),
-                            metric=v.metric_request().metric,
-                            success=False,
-                            value=None,
-                            filter_sql=v.where_condition,
-                            details={"error": str(exc), "traceback": tb},
-                        )
-                    )
-
-        # -- custom validators ------------------------------------------
-        for eng_key, table, v in custom_bindings:
+            engines[id(engine)] = engine
+            metric_work[id(engine)].append((eng_key, table, validators))
+        for pos, (eng_key, table, v) in enumerate(custom_bindings):
             engine = self.engine_map[eng_key]
-            sql_or_ast = v.custom_sql(table)
-            sql = sql_or_ast.sql() if isinstance(sql_or_ast, exp.Expression) else str(sql_or_ast)
-            err = ""
-            err_tb = ""
+            engines[id(engine)] = engine
+            custom_work[id(engine)].append((pos, table, v))
+
+        def _engine_task(engine_id: int):
+            engine = engines[engine_id]
+            metric = self._engine_metric_results(
+                engine, metric_work.get(engine_id, []), run_id, collector
+            )
+            custom = [
+                (pos, self._custom_result(engine, table, v, run_id))
+                for pos, table, v in custom_work.get(engine_id, [])
+            ]
+            return metric, custom
+
+        if self.max_workers and self.max_workers > 1 and len(engines) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(engines))) as pool:
+                outcomes = list(pool.map(_engine_task, engines))
+        else:
+            outcomes = [_engine_task(engine_id) for engine_id in engines]
+
+        # Metric results in first-appearance order of their (engine, table)
+        # group, then custom ones in binding order.
+        group_results: Dict[Tuple[str, str], List[ValidationResult]] = {}
+        group_stats: Dict[Tuple[str, str], List["MetricStat"]] = {}
+        custom_results: Dict[int, ValidationResult] = {}
+        for metric, custom in outcomes:
+            for key, table_results, table_stats in metric:
+                group_results[key] = table_results
+                group_stats[key] = table_stats
+            custom_results.update(custom)
+        results = [r for key in metric_groups for r in group_results.get(key, ())]
+        results.extend(custom_results[pos] for pos in range(len(custom_bindings)))
+        stats = [s for key in metric_groups for s in group_stats.get(key, ())]
+        return results, stats
+
+    # ------------------------------------------------------------------ #
+    # Internal helpers                                                   #
+    # ------------------------------------------------------------------ #
+    @classmethod
+    def _engine_metric_results(
+        cls,
+        engine: BaseEngine,
+        groups: List[Tuple[str, str, List[ValidatorBase]]],
+        run_id: str,
+        collector: Optional["TableStatsCollector"] = None,
+    ) -> List[Tuple[Tuple[str, str], List[ValidationResult], List["MetricStat"]]]:
+        """
+        One fused query for all of *engine*'s ``(engine_key, table)`` groups;
+        per-table queries on failure.  Returns each group's results and
+        statistics.
+        """
+        # Statistics aliases are namespaced per table so the fused query
+        # never sees the same alias twice.  A table whose columns cannot be
+        # listed gets no statistics; its own query reports the error.
+        plans: List[Tuple[List[Any], Dict[str, Any]]] = []
+        for i, (eng_key, table, _) in enumerate(groups):
+            plan: Tuple[List[Any], Dict[str, Any]] = ([], {})
+            if collector is not None:
+                try:
+                    plan = collector.plan_requests(eng_key, table, alias_prefix=f"s{i}_m")
+                except (duckdb.Error, ValueError, RuntimeError):
+                    pass
+            plans.append(plan)
+
+        dialect = engine.get_dialect()
+        batches = [
+            (eng_key, table, validators, alias_map, MetricBatchBuilder(
+                table=table,
+                requests=[*(v.metric_request() for v in validators), *stat_requests],
+                dialect=dialect,
+            ))
+            for (eng_key, table, validators), (stat_requests, alias_map) in zip(groups, plans)
+            if validators or stat_requests
+        ]
+        row: Optional[Dict[str, Any]] = None
+        if len(batches) > 1:
+            builders = [b[-1] for b in batches]
             try:
-                df = engine.run_sql(sql)
-                ok = v.interpret(df)
-                raw_val = None
-            except (duckdb.Error, ValueError, RuntimeError) as exc:
-                ok = False
-                raw_val = None
-                err = str(exc)
-                err_tb = traceback.format_exc()
-
-            base_details = getattr(v, "details", {})
-            details = (
-                base_details
-                if ok
-                else {**base_details, "error": err, "traceback": err_tb}
+                row = first_row(engine.run_sql(builders[0].union(builders[1:])))
+            except (duckdb.Error, ValueError, RuntimeError):
+                row = None  # isolate the failing table below
+        out = []
+        for eng_key, table, validators, alias_map, builder in batches:
+            table_results, table_row = cls._metric_results(
+                engine, table, validators, builder, row, run_id
             )
-            results.append(
+            table_stats: List["MetricStat"] = []
+            if alias_map and table_row is not None:
+                table_stats = collector.stats_from_row(
+                    eng_key, table, alias_map, table_row, run_id=run_id
+                )
+            out.append(((eng_key, table), table_results, table_stats))
+        return out
+
+    @staticmethod
+    def _custom_result(
+        engine: BaseEngine, table: str, v: ValidatorBase, run_id: str
+    ) -> ValidationResult:
+        """Run one custom validator's query and interpret it."""
+        sql_or_ast = v.custom_sql(table)
+        sql = sql_or_ast.sql() if isinstance(sql_or_ast, exp.Expression) else str(sql_or_ast)
+        err = ""
+        err_tb = ""
+        try:
+            df = engine.run_sql(sql)
+            ok = v.interpret(df)
+            raw_val = None
+        except (duckdb.Error, ValueError, RuntimeError) as exc:
+            ok = False
+            raw_val = None
+            err = str(exc)
+            err_tb = traceback.format_exc()
+
+        base_details = getattr(v, "details", {})
+        details = (
+            base_details
+            if ok
+            else {**base_details, "error": err, "traceback": err_tb}
+        )
+        return ValidationResult(
+            run_id=run_id,
+            validator=v.__class__.__name__,
+            table=table,
+            column=getattr(v, "column", None),
+            success=ok,
+            value=raw_val,
+            details=details,
+        )
+
+    @staticmethod
+    def _metric_results(
+        engine: BaseEngine,
+        table: str,
+        validators: List[ValidatorBase],
+        builder: MetricBatchBuilder,
+        row: Optional[Dict[str, Any]],
+        run_id: str,
+    ) -> Tuple[List[ValidationResult], Optional[Dict[str, Any]]]:
+        """
+        Interpret one table's metric batch, querying it unless *row* has it.
+
+        Also returns the row the results were read from (``None`` when the
+        query failed) so callers can pick extra aliases out of it.
+        """
+        # builder.requests is parallel to *validators*; reuse it instead of
+        # calling metric_request() again per result.  Columns are read once
+        # here for both the success and the failure branch.
+        entries = [
+            (v, req, getattr(v, "column", None))
+            for v, req in zip(validators, builder.requests)
+        ]
+        results: List[ValidationResult] = []
+        append = results.append
+        try:
+            if row is None:
+                row = first_row(engine.run_sql(builder.sql()))
+            for v, req, column in entries:
+                val = row[v.runtime_id]
+                ok = v.interpret(val)
+                append(
+                    ValidationResult(
+                        run_id=run_id,
+                        validator=type(v).__name__,
+                        table=table,
+                        column=column,
+                        metric=req.metric,
+                        success=ok,
+                        value=val,
+                        filter_sql=v.where_condition,
+                    )
+                )
+        except (duckdb.Error, ValueError, RuntimeError) as exc:
+            # Format once per failed group; every validator shares the text.
+            details = {"error": str(exc), "traceback": traceback.format_exc()}
+            results = [
                 ValidationResult(
                     run_id=run_id,
-                    validator=v.__class__.__name__,
+                    validator=type(v).__name__,
                     table=table,
-                    column=getattr(v, "column", None),
-                    success=ok,
-                    value=raw_val,
+                    column=column,
+                    metric=req.metric,
+                    success=False,
+                    value=None,
+                    filter_sql=v.where_condition,
                     details=details,
                 )
-            )
-
-        return results
+                for v, req, column in entries
+            ]
+        return results, row
 
 
 # --------------------------------------------------------------------------- #
@@ -6,6 +6,7 @@ import pandas as pd
 
 from src.expectations.engines.base import BaseEngine
 from src.expectations.metrics.batch_builder import MetricBatchBuilder, MetricRequest
+from src.expectations.utils import first_row
 
 from .models import MetricStat
 
@@ -30,11 +31,40 @@ class TableStatsCollector:
     ) -> List[MetricStat]:
         """Return statistics for *table* as a list of :class:`MetricStat`."""
 
+        requests, alias_map = self.plan_requests(
+            engine_key,
+            table,
+            column_metrics=column_metrics,
+            table_metrics=table_metrics,
+        )
+        engine = self.engine_map[engine_key]
+        sql = MetricBatchBuilder(
+            table=table, requests=requests, dialect=engine.get_dialect()
+        ).sql()
+        df: pd.DataFrame = engine.run_sql(sql)
+        return self.stats_from_row(engine_key, table, alias_map, first_row(df), run_id=run_id)
+
+    def plan_requests(
+        self,
+        engine_key: str,
+        table: str,
+        *,
+        column_metrics: Sequence[str] | None = None,
+        table_metrics: Sequence[str] | None = None,
+        alias_prefix: str = "m",
+    ) -> Tuple[List[MetricRequest], Dict[str, Tuple[Optional[str], str]]]:
+        """
+        Return the metric requests for *table* and their ``alias -> (column,
+        metric)`` map, without running anything.
+
+        Lets callers fold the statistics into a larger batch (see
+        :py:meth:`ValidationRunner.run_with_stats`); *alias_prefix* keeps the
+        aliases unique there.
+        """
         col_metrics = tuple(column_metrics or self.DEFAULT_COLUMN_METRICS)
         tbl_metrics = tuple(table_metrics or self.DEFAULT_TABLE_METRICS)
 
-        engine = self.engine_map[engine_key]
-        columns = engine.list_columns(table)
+        columns = self.engine_map[engine_key].list_columns(table)
 
         alias_map: Dict[str, Tuple[Optional[str], str]] = {}
         requests: List[MetricRequest] = []
@@ -42,7 +72,7 @@ class TableStatsCollector:
         idx = 0
         # table-level metrics
         for metric in tbl_metrics:
-            alias = f"m{idx}"
+            alias = f"{alias_prefix}{idx}"
             idx += 1
             requests.append(MetricRequest(column="*", metric=metric, alias=alias))
             alias_map[alias] = (None, metric)
@@ -50,19 +80,25 @@ class TableStatsCollector:
         # column metrics
         for col in columns:
             for metric in col_metrics:
-                alias = f"m{idx}"
+                alias = f"{alias_prefix}{idx}"
                 idx += 1
                 requests.append(
                     MetricRequest(column=col, metric=metric, alias=alias)
                 )
                 alias_map[alias] = (col, metric)
 
-        sql = MetricBatchBuilder(
-            table=table, requests=requests, dialect=engine.get_dialect()
-        ).sql()
-        df: pd.DataFrame = engine.run_sql(sql)
-        row = df.iloc[0]
+        return requests, alias_map
 
+    @staticmethod
+    def stats_from_row(
+        engine_key: str,
+        table: str,
+        alias_map: Dict[str, Tuple[Optional[str], str]],
+        row: Dict[str, object],
+        *,
+        run_id: str,
+    ) -> List[MetricStat]:
+        """Turn a result *row* keyed by :py:meth:`plan_requests` aliases into stats."""
         stats: List[MetricStat] = []
         schema = None
         if "." in table:
@@ -1,18 +1,91 @@
 from __future__ import annotations
 
 import json
+import math
+import re
 from pathlib import Path
-from typing import Sequence, Optional
+from typing import Any, List, Optional, Sequence, Tuple
 
 from src.expectations.config.expectation import SLAConfig
 
 import duckdb
+import numpy as np
+import pandas as pd
 
 from src.expectations.result_model import RunMetadata, ValidationResult
 from src.expectations.stats import MetricStat
 from .base import BaseResultStore
 from src.expectations.engines.duckdb import DuckDBEngine
 
+try:  # optional C-accelerated JSON encoder
+    from orjson import OPT_SERIALIZE_NUMPY, dumps as _orjson_dumps
+except ImportError:  # pragma: no cover - fall back to the stdlib
+    _orjson_dumps = None
+
+
+_RESULT_COLUMNS = (
+    "run_id", "validator", "table_name", "column_name", "engine_name", "schema",
+    "metric", "success", "value", "severity", "filter_sql", "details",
+)
+_STAT_COLUMNS = (
+    "run_id", "table_name", "column_name", "engine_name", "schema", "metric", "value",
+)
+
+
+def _value_text(value: Any) -> Optional[str]:
+    """Render *value* as DuckDB casts a bound parameter to ``TEXT``.
+
+    Bulk inserts go through a DataFrame, where a mixed ``object`` column would
+    otherwise be stringified by Python (``True`` instead of ``true``).
+    """
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+# A JSON string literal (skipped) or the exponent of a number.
+_JSON_EXPONENT = re.compile(r'("(?:[^"\\]|\\.)*")|e\+?(-?)0*(\d)')
+
+
+def _orjson_exponent(match: "re.Match[str]") -> str:
+    return match.group(1) or f"e{match.group(2)}{match.group(3)}"
+
+
+def _jsonable(value: Any) -> Any:
+    """Convert *value* for :func:`json.dumps` the way orjson serialises it."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {k: _jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [_jsonable(v) for v in value]
+    if isinstance(value, np.floating):
+        # Shortest repr at the scalar's own precision (float32 0.1 -> 0.1).
+        return _jsonable(float(str(value)))
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _details_json(details: Any) -> str:
+    """Encode a result's ``details`` dict as compact UTF-8 JSON.
+
+    orjson is used when it is installed; the stdlib fallback produces the
+    same text: ``,``/``:`` separators, non-ASCII kept as is, NaN and
+    infinities as ``null``, and orjson's exponent style (``1e20``).
+    """
+    if _orjson_dumps is not None:
+        try:
+            return _orjson_dumps(details, option=OPT_SERIALIZE_NUMPY).decode()
+        except TypeError:
+            pass  # e.g. non-str keys, which the stdlib encoder coerces
+    text = json.dumps(_jsonable(details), separators=(",", ":"), ensure_ascii=False)
+    return _JSON_EXPONENT.sub(_orjson_exponent, text)
+
 
 class DuckDBResultStore(BaseResultStore):
     """Persist results into a DuckDB database using :class:`DuckDBEngine`."""
@@ -78,6 +151,9 @@ class DuckDBResultStore(BaseResultStore):
         self._engine.connection.execute(
             "CREATE INDEX IF NOT EXISTS stats_lookup ON statistics(engine_name, schema, table_name, column_name, metric)"
         )
+        # Parsed once; persist_run re-binds them instead of re-parsing the SQL.
+        self._upsert_sla = self._engine.prepare("INSERT OR REPLACE INTO slas VALUES (?, ?)")
+        self._insert_run = self._engine.prepare("INSERT INTO runs VALUES (?, ?, ?, ?, ?, ?, ?)")
 
     # ------------------------------------------------------------------ #
     # BaseResultStore interface
@@ -88,61 +164,97 @@ class DuckDBResultStore(BaseResultStore):
         results: Sequence[ValidationResult],
         sla_config: SLAConfig | None = None,
     ) -> None:
-        if run.sla_name and sla_config is not None:
-            self._engine.connection.execute(
-                "INSERT OR REPLACE INTO slas VALUES (?, ?)",
-                (run.sla_name, json.dumps(sla_config.model_dump())),
-            )
-        self._engine.connection.execute(
-            "INSERT INTO runs VALUES (?, ?, ?, ?, ?, ?, ?)",
-            (
-                run.run_id,
-                run.suite_name,
-                run.sla_name,
-                run.engine_name,
-                run.db_schema,
-                run.started_at,
-                run.finished_at,
-            ),
-        )
-        for r in results:
-            self._engine.connection.execute(
-                "INSERT INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        # One transaction: a single commit, and no half-persisted runs.
+        with self._engine.transaction() as conn:
+            if run.sla_name and sla_config is not None:
+                conn.execute(
+                    self._upsert_sla,
+                    (run.sla_name, sla_config.model_dump_json()),
+                )
+            conn.execute(
+                self._insert_run,
                 (
-                    r.run_id,
-                    r.validator,
-                    r.table,
-                    r.column,
-                    r.engine_name,
-                    r.db_schema,
-                    r.metric,
-                    r.success,
-                    r.value,
-                    r.severity,
-                    r.filter_sql,
-                    json.dumps(r.details),
+                    run.run_id,
+                    run.suite_name,
+                    run.sla_name,
+                    run.engine_name,
+                    run.db_schema,
+                    run.started_at,
+                    run.finished_at,
                 ),
             )
+            if results:
+                self._bulk_insert(
+                    conn,
+                    "results",
+                    _RESULT_COLUMNS,
+                    [
+                        (
+                            r.run_id,
+                            r.validator,
+                            r.table,
+                            r.column,
+                            r.engine_name,
+                            r.db_schema,
+                            r.metric,
+                            r.success,
+                            _value_text(r.value),
+                            r.severity,
+                            r.filter_sql,
+                            _details_json(r.details),
+                        )
+                        for r in results
+                    ],
+                )
 
     def persist_stats(
         self, run: RunMetadata, stats: Sequence["MetricStat"]
     ) -> None:
         """Persist statistics for a run."""
 
-        for s in stats:
-            self._engine.connection.execute(
-                "INSERT INTO statistics VALUES (?, ?, ?, ?, ?, ?, ?)",
-                (
-                    s.run_id,
-                    s.table,
-                    s.column,
-                    s.engine_name or run.engine_name,
-                    s.db_schema or run.db_schema,
-                    s.metric,
-                    s.value,
-                ),
+        if not stats:
+            return
+        with self._engine.transaction() as conn:
+            self._bulk_insert(
+                conn,
+                "statistics",
+                _STAT_COLUMNS,
+                [
+                    (
+                        s.run_id,
+                        s.table,
+                        s.column,
+                        s.engine_name or run.engine_name,
+                        s.db_schema or run.db_schema,
+                        s.metric,
+                        _value_text(s.value),
+                    )
+                    for s in stats
+                ],
             )
 
+    @staticmethod
+    def _bulk_insert(
+        conn: duckdb.DuckDBPyConnection,
+        table: str,
+        columns: Tuple[str, ...],
+        rows: List[Tuple[Any, ...]],
+    ) -> None:
+        """Insert *rows* with one ``INSERT ... SELECT`` over a registered frame.
+
+        DuckDB scans the DataFrame column-wise, which is orders of magnitude
+        cheaper than binding parameters row by row (``executemany``).
+        """
+        frame = pd.DataFrame.from_records(rows, columns=list(columns))
+        # Registrations are per connection, so the fixed name cannot clash
+        # between threads.
+        name = f"__{table}_batch"
+        conn.register(name, frame)
+        try:
+            conn.execute(f"INSERT INTO {table} BY NAME SELECT * FROM {name}")
+        finally:
+            conn.unregister(name)
+
     @property
     def connection(self) -> duckdb.DuckDBPyConnection:  # pragma: no cover - helper
         return self._engine.connection
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import gzip
 import json
 from pathlib import Path
 from typing import Sequence
@@ -11,9 +12,14 @@ from .base import BaseResultStore
 
 
 class FileResultStore(BaseResultStore):
-    """Persist validation artefacts to a directory as JSON files."""
+    """Persist validation artefacts to a directory as JSON files.
 
-    def __init__(self, directory: str | Path):
+    With ``compress=True`` the per-run result and statistics JSON-lines files
+    are gzip-compressed (``<run_id>.jsonl.gz``); they typically shrink 5-15x.
+    """
+
+    def __init__(self, directory: str | Path, *, compress: bool = False):
+        self.compress = compress
         self.base_path = Path(directory)
         self.base_path.mkdir(parents=True, exist_ok=True)
         for sub in ("runs", "results", "slas", "statistics"):
@@ -31,22 +37,30 @@ class FileResultStore(BaseResultStore):
         run_path = self.base_path / "runs" / f"{run.run_id}.json"
         run_path.write_text(run.model_dump_json())
 
-        res_path = self.base_path / "results" / f"{run.run_id}.jsonl"
-        with res_path.open("w") as fh:
-            for r in results:
-                fh.write(r.model_dump_json())
-                fh.write("\n")
+        # One write per file rather than two per record.
+        self._write_lines(
+            self.base_path / "results" / f"{run.run_id}.jsonl",
+            "".join(f"{r.model_dump_json()}\n" for r in results),
+        )
 
         if run.sla_name and sla_config is not None:
             sla_path = self.base_path / "slas" / f"{run.sla_name}.json"
             sla_path.write_text(sla_config.model_dump_json())
 
     def persist_stats(self, run: RunMetadata, stats: Sequence[MetricStat]) -> None:
-        stats_path = self.base_path / "statistics" / f"{run.run_id}.jsonl"
-        with stats_path.open("w") as fh:
-            for s in stats:
-                fh.write(s.model_dump_json())
-                fh.write("\n")
+        self._write_lines(
+            self.base_path / "statistics" / f"{run.run_id}.jsonl",
+            "".join(f"{s.model_dump_json()}\n" for s in stats),
+        )
+
+    def _write_lines(self, path: Path, text: str) -> None:
+        """Write JSON-lines *text* to *path*, or ``<path>.gz`` when compressing."""
+        if self.compress:
+            # Level 3 keeps most of the size win at a fraction of level 9's CPU.
+            with gzip.open(path.with_name(path.name + ".gz"), "wt", compresslevel=3) as fh:
+                fh.write(text)
+        else:
+            path.write_text(text)
 
     def close(self) -> None:  # pragma: no cover - nothing to close
         pass
@@ -0,0 +1,15 @@
+# src/expectations/utils.py
+from __future__ import annotations
+
+from typing import Any, Dict
+
+import pandas as pd
+
+
+def first_row(df: pd.DataFrame) -> Dict[str, Any]:
+    """First row of *df* as ``{column: value}``; values keep their dtypes.
+
+    A plain dict makes the per-validator lookups hash hits instead of
+    pandas label indexing.
+    """
+    return dict(zip(df.columns, df.iloc[0].values))
@@ -13,7 +13,6 @@ The runner handles both transparently.
 from __future__ import annotations
 
 import os
-import ulid
 from abc import ABC, abstractmethod
 from typing import Literal, Optional
 
@@ -21,6 +20,18 @@ from sqlglot import exp
 
 from src.expectations.metrics.batch_builder import MetricRequest
 
+# Process id baked into runtime ids; refreshed in forked children so ids
+# minted there never collide with the parent's.
+_PID = os.getpid()
+
+
+def _refresh_pid() -> None:
+    global _PID
+    _PID = os.getpid()
+
+
+if hasattr(os, "register_at_fork"):  # POSIX only
+    os.register_at_fork(after_in_child=_refresh_pid)
 
 
 class ValidatorBase(ABC):
@@ -31,8 +42,9 @@ class ValidatorBase(ABC):
     # ------------------------------------------------------------------ #
     def __init__(self, *, where: str | None = None):
         self.where_condition: Optional[str] = where
-        # ULID string is 26 chars -> "v<pid>_<ulid>" still well under 63 chars
-        self.runtime_id: str = f"v{os.getpid()}_{ulid.new().str}"
+        # 128 random bits as 32 hex chars -> "v<pid>_<hex>" stays well under
+        # the 63-char identifier limit; no UUID/ULID object is built.
+        self.runtime_id: str = f"v{_PID}_{os.urandom(16).hex()}"
 
     # ------------------------------------------------------------------ #
     # Classification                                                     #
@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-from datetime import datetime
 from typing import Sequence, Tuple
 
 from src.expectations.runner import ValidationRunner, ValidatorBinding
 from src.expectations.store.base import BaseResultStore
-from src.expectations.result_model import RunMetadata, ValidationResult
+from src.expectations.result_model import RunMetadata, ValidationResult, utcnow
 from src.expectations.config.expectation import SLAConfig
 
 
@@ -41,7 +40,7 @@ def run_validations(
     for r in results:
         r.engine_name = run.engine_name
         r.db_schema = run.db_schema
-    run.finished_at = datetime.utcnow()
+    run.finished_at = utcnow()
     store.persist_run(run, results, sla_config)
     return run, results
 
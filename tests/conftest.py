@@ -0,0 +1,12 @@
+import pytest
+
+from src.expectations.metrics import registry
+
+
+@pytest.fixture
+def restore_metric_registry():
+    """Unregister every metric the test added, bumping the registry version."""
+    before = set(registry.available_metrics())
+    yield
+    for name in set(registry.available_metrics()) - before:
+        registry.unregister_metric(name)
@@ -80,3 +80,133 @@ def test_filtered_distinct_and_non_null_counts():
     assert "COUNT(DISTINCT CASE WHEN b = 1 THEN a END)" in sql
     assert "COUNT(CASE WHEN b = 1 AND NOT a IS NULL THEN 1 END)" in sql
 
+
+
+def test_sql_cached_per_request_set():
+    from src.expectations.metrics import batch_builder
+
+    reqs = [MetricRequest(column="a", metric="max", alias="mx", filter_sql="b < 5")]
+    first = MetricBatchBuilder(table="t", requests=reqs, dialect="duckdb").sql()
+    key = next(k for k, v in batch_builder._SQL_CACHE.items() if v == first)
+    assert key[0] == "t" and key[1] == "duckdb"
+
+    second = MetricBatchBuilder(table="t", requests=list(reqs), dialect="duckdb").sql()
+    assert second is first
+    assert MetricBatchBuilder(table="u", requests=reqs, dialect="duckdb").sql() != first
+
+
+def test_known_metrics_refresh_after_registration(restore_metric_registry):
+    from sqlglot import exp
+
+    from src.expectations.metrics import registry
+
+    with pytest.raises(ValueError):
+        MetricRequest(column="a", metric="_late_metric", alias="x")
+
+    @registry.register_metric("_late_metric")
+    def _late(col: str) -> exp.Expression:
+        return exp.Max(this=exp.column(col))
+
+    req = MetricRequest(column="a", metric="_late_metric", alias="x")
+    builder = MetricBatchBuilder(table="t", requests=[req], dialect="duckdb")
+    assert "MAX(a)" in builder.sql()
+
+    registry.unregister_metric("_late_metric")
+    with pytest.raises(ValueError):
+        MetricRequest(column="a", metric="_late_metric", alias="x")
+
+
+def test_metric_using_column_as_literal_is_not_templated(restore_metric_registry):
+    from sqlglot import exp
+
+    from src.expectations.metrics import registry
+
+    @registry.register_metric("_col_literal")
+    def _lit(col: str) -> exp.Expression:
+        return exp.Max(this=exp.Literal.string(col))
+
+    req = MetricRequest(column="a", metric="_col_literal", alias="x")
+    sql = MetricBatchBuilder(table="t", requests=[req], dialect="duckdb").sql()
+    assert "MAX('a')" in sql
+
+
+@pytest.mark.parametrize("dialect", ["duckdb", "postgres", "snowflake"])
+def test_sql_matches_ast_rendering(dialect):
+    from src.expectations.metrics.registry import available_metrics
+
+    reqs = [
+        MetricRequest(column=col, metric=m, alias=f"{m}_{i}", filter_sql=flt)
+        for i, (col, flt) in enumerate(
+            [("a", None), ("b c", None), ("a", "b > 1"), ("x", "a IS NULL")]
+        )
+        for m in available_metrics()
+    ]
+    builder = MetricBatchBuilder(table="s.t", requests=reqs, dialect=dialect)
+    assert builder.sql() == builder.build_query_ast().sql(dialect=dialect, pretty=False)
+
+
+def test_union_fuses_batches():
+    eng = DuckDBEngine()
+    eng.register_dataframe("t1", pd.DataFrame({"a": [1, 2, 3]}))
+    eng.register_dataframe("t2", pd.DataFrame({"a": [5, 5]}))
+    b1 = MetricBatchBuilder(
+        table="t1",
+        requests=[MetricRequest(column="a", metric="row_cnt", alias="r1")],
+        dialect="duckdb",
+    )
+    b2 = MetricBatchBuilder(
+        table="t2",
+        requests=[MetricRequest(column="a", metric="max", alias="m2")],
+        dialect="duckdb",
+    )
+    df = eng.run_sql(b1.union([b2]))
+    assert len(df) == 1
+    assert df.iloc[0]["r1"] == 3 and df.iloc[0]["m2"] == 5
+
+    with pytest.raises(ValueError):
+        b1.union([b1])
+
+
+def test_builder_is_hashable():
+    reqs = [MetricRequest(column="a", metric="row_cnt", alias="r")]
+    b1 = MetricBatchBuilder(table="t", requests=reqs, dialect="duckdb")
+    b2 = MetricBatchBuilder(table="t", requests=list(reqs), dialect="duckdb")
+    assert isinstance(b1.requests, tuple)
+    assert b1 == b2 and len({b1, b2}) == 1
+    assert not hasattr(b1, "__dict__")
+
+
+def test_plan_many_matches_serial_planning():
+    specs = [
+        (
+            f"t{i}",
+            [MetricRequest(column="a", metric="max", alias=f"m{i}", filter_sql=f"b > {i}")],
+            "duckdb",
+        )
+        for i in range(8)
+    ]
+    planned = MetricBatchBuilder.plan_many(specs, max_workers=4)
+    assert planned == [
+        MetricBatchBuilder(table=t, requests=r, dialect=d).sql() for t, r, d in specs
+    ]
+
+
+@pytest.mark.parametrize(
+    "predicate",
+    ["a > 1", "a >= -2.5", "a = 'it''s'", "a <> NULL", "a IS NULL", "a is not null", "b!=3"],
+)
+def test_simple_filters_skip_parser_but_match_it(predicate):
+    from sqlglot import parse_one
+
+    from src.expectations.metrics.utils import _fast_predicate
+
+    fast = _fast_predicate(predicate)
+    assert fast is not None
+    assert fast == parse_one(predicate)
+
+
+def test_semicolon_rejected_before_parsing():
+    from src.expectations.metrics.utils import validate_filter_sql
+
+    with pytest.raises(ValidationConfigError, match="Semicolons"):
+        validate_filter_sql("a = 'x;y'")
@@ -20,13 +20,10 @@ def _worker(i: int) -> bool:
     eng.register_dataframe("t", pd.DataFrame({"a": [1, 2]}))
     runner = ValidationRunner({"duck": eng})
     res = runner.run([("duck", "t", ColumnNotNull(column="a"))], run_id=f"test_{i}")[0]
-
-    # cleanup
-    registry.MetricRegistry.instance()._metrics.pop(name, None)
     return res.success
 
 
-def test_parallel_registry_and_engine():
+def test_parallel_registry_and_engine(restore_metric_registry):
     with ThreadPoolExecutor(max_workers=4) as exe:
         results = list(exe.map(_worker, range(4)))
     assert all(results)
@@ -29,3 +29,131 @@ def test_run_many_fallback():
     eng = DummyEngine()
     res = eng.run_many(["SELECT 1", "SELECT 2"])
     assert len(res) == 2
+
+
+def test_duckdb_pool_shared_across_threads(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    eng = DuckDBEngine(tmp_path / "pool.db", pool_size=2)
+    eng.run_sql("CREATE TABLE t AS SELECT range AS a FROM range(10)")
+
+    def _count(_):
+        return int(eng.run_sql("SELECT COUNT(*) AS c FROM t").iloc[0]["c"])
+
+    with ThreadPoolExecutor(max_workers=4) as exe:
+        assert list(exe.map(_count, range(20))) == [10] * 20
+    eng.close()
+
+
+def test_duckdb_run_many_fused():
+    eng = DuckDBEngine()
+    eng.register_dataframe("t", pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]}))
+    res = eng.run_many(
+        [
+            "SELECT COUNT(*) AS c FROM t",
+            "SELECT a, b FROM t ORDER BY a",
+            "SELECT a FROM t WHERE a > 10",
+            "SELECT a, a FROM t",  # duplicate names cannot be fused
+        ]
+    )
+    assert res[0].iloc[0]["c"] == 3
+    assert res[1]["b"].tolist() == ["x", "y", "z"]
+    assert res[2].empty and list(res[2].columns) == ["a"]
+    assert len(res[3]) == 3
+
+
+def test_duckdb_registered_dataframe_visible_from_threads():
+    from concurrent.futures import ThreadPoolExecutor
+
+    eng = DuckDBEngine()
+    eng.register_dataframe("t", pd.DataFrame({"a": [1, 2, 3]}))
+
+    def _cols(_):
+        return eng.list_columns("t")
+
+    with ThreadPoolExecutor(max_workers=3) as exe:
+        assert list(exe.map(_cols, range(6))) == [["a"]] * 6
+    eng.close()
+
+
+def test_duckdb_prepared_statements():
+    eng = DuckDBEngine()
+    eng.register_dataframe("t", pd.DataFrame({"a": [1, 2, 3]}))
+    stmt = eng.prepare("SELECT COUNT(*) AS c FROM t WHERE a > ?")
+    assert eng.prepare(" SELECT COUNT(*) AS c FROM t WHERE a > ? ") is stmt
+    assert eng.run_prepared(stmt, [1]).iloc[0]["c"] == 2
+    assert eng.run_prepared(stmt, [2]).iloc[0]["c"] == 1
+
+
+def test_duckdb_run_many_column_named_like_aliases(monkeypatch):
+    eng = DuckDBEngine()
+    eng.register_dataframe("t", pd.DataFrame({"a": [1, 2, 3]}))
+
+    def no_fallback(conn, sql):  # pragma: no cover - must not be reached
+        raise AssertionError("single-row statements were not fused")
+
+    monkeypatch.setattr(eng, "_execute", no_fallback)
+    res = eng.run_many(["SELECT SUM(a) AS s FROM t", "SELECT 2 AS b, 3 AS q0"])
+    assert res[0].iloc[0]["s"] == 6
+    assert list(res[1].columns) == ["b", "q0"] and res[1].iloc[0]["q0"] == 3
+
+
+def test_duckdb_run_many_dtypes_match_run_sql():
+    eng = DuckDBEngine()
+    eng.run_sql(
+        "CREATE TABLE t AS SELECT * FROM (VALUES "
+        "(1, 1.50::DECIMAL(10, 2), DATE '2024-01-01', NULL::DOUBLE), "
+        "(2, 2.50::DECIMAL(10, 2), DATE '2024-01-02', NULL::DOUBLE)) v(a, d, dt, n)"
+    )
+    stmts = [
+        "SELECT AVG(n) AS avg_n FROM t",
+        "SELECT SUM(d) AS sum_d FROM t",
+        "SELECT MIN(dt) AS min_dt FROM t",
+        "SELECT SUM(a) AS sum_a FROM t",
+    ]
+    for fused, single in zip(eng.run_many(stmts), (eng.run_sql(s) for s in stmts)):
+        pd.testing.assert_frame_equal(fused, single)
+
+
+def test_duckdb_run_many_runs_unfusible_batches_once(monkeypatch):
+    eng = DuckDBEngine()
+    eng.run_sql("CREATE SEQUENCE s")
+    res = eng.run_many(["SELECT nextval('s') AS v", "SELECT nextval('s') AS v"])
+    assert [int(df.iloc[0]["v"]) for df in res] == [1, 2]
+
+    eng.register_dataframe("t", pd.DataFrame({"a": [1, 2, 3]}))
+    calls = []
+    original = eng._execute
+    monkeypatch.setattr(eng, "_execute", lambda conn, sql: calls.append(sql) or original(conn, sql))
+    res = eng.run_many(["SELECT COUNT(*) AS c FROM t", "SELECT a FROM t LIMIT 1"])
+    assert calls == ["SELECT COUNT(*) AS c FROM t", "SELECT a FROM t LIMIT 1"]
+    assert res[0].iloc[0]["c"] == 3 and res[1].iloc[0]["a"] == 1
+
+
+def test_duckdb_temp_tables_visible_from_threads():
+    from concurrent.futures import ThreadPoolExecutor
+
+    eng = DuckDBEngine()
+    eng.run_sql("CREATE TEMP TABLE tmp AS SELECT range AS a FROM range(3)")
+
+    def _count(_):
+        return int(eng.run_sql("SELECT COUNT(*) AS c FROM tmp").iloc[0]["c"])
+
+    with ThreadPoolExecutor(max_workers=3) as exe:
+        assert list(exe.map(_count, range(6))) == [3] * 6
+    eng.close()
+
+
+def test_duckdb_transaction_rolls_back_on_error():
+    import pytest
+
+    eng = DuckDBEngine()
+    eng.run_sql("CREATE TABLE t (a INTEGER)")
+    with eng.transaction() as conn:
+        conn.execute("INSERT INTO t VALUES (1)")
+    with pytest.raises(ValueError):
+        with eng.transaction() as conn:
+            conn.execute("INSERT INTO t VALUES (2)")
+            raise ValueError("boom")
+    assert eng.run_sql("SELECT a FROM t")["a"].tolist() == [1]
+    eng.close()
@@ -1,4 +1,5 @@
 import json
+import os
 import tempfile
 import yaml
 import pytest
@@ -120,3 +121,105 @@ def test_resolve_validator_class(monkeypatch):
     assert cls2 is RowCountValidator
     with pytest.raises(AttributeError):
         _resolve_validator_class("Nope")
+
+
+def test_from_yaml_cached_until_file_changes(tmp_path):
+    path = tmp_path / "suite.yml"
+    path.write_text(
+        "suite_name: s\nengine: duck\ntable: t\nexpectations:\n"
+        "  - expectation_type: ColumnNotNull\n    column: a\n"
+    )
+    first = ExpectationSuiteConfig.from_yaml(path)
+    first.expectations.clear()
+    second = ExpectationSuiteConfig.from_yaml(path)
+    assert second is not first
+    assert len(second.expectations) == 1
+
+    path.write_text(
+        "suite_name: changed\nengine: duck\ntable: t\nexpectations: []\n"
+    )
+    third = ExpectationSuiteConfig.from_yaml(path)
+    assert third.suite_name == "changed"
+
+
+def test_from_yaml_cache_keys_on_absolute_path(tmp_path, monkeypatch):
+    for name in ("a", "b"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "suite.yml").write_text(
+            f"suite_name: {name}\nengine: duck\ntable: t\nexpectations: []\n"
+        )
+        os.utime(tmp_path / name / "suite.yml", ns=(1_000_000_000, 1_000_000_000))
+    monkeypatch.chdir(tmp_path / "a")
+    assert ExpectationSuiteConfig.from_yaml("suite.yml").suite_name == "a"
+    monkeypatch.chdir(tmp_path / "b")
+    assert ExpectationSuiteConfig.from_yaml("suite.yml").suite_name == "b"
+
+
+def test_from_yaml_fast_builds_same_validators(tmp_path):
+    path = tmp_path / "suite.yml"
+    path.write_text(
+        "suite_name: s\nengine: duck\ntable: t\nexpectations:\n"
+        "  - expectation_type: ColumnNotNull\n    column: a\n"
+    )
+    fast = ExpectationSuiteConfig.from_yaml_fast(path)
+    assert not isinstance(fast, ExpectationSuiteConfig)
+    assert fast.suite_name == "s"
+    (binding,) = fast.build_validators()
+    assert binding[:2] == ("duck", "t")
+    assert isinstance(binding[2], ColumnNotNull)
+
+
+def test_from_yaml_fast_ignores_unknown_keys(tmp_path):
+    path = tmp_path / "suite.yml"
+    path.write_text(
+        "suite_name: s\nengine: duck\ntable: t\nowner: me\nexpectations:\n"
+        "  - expectation_type: ColumnNotNull\n    column: a\n    note: extra\n"
+    )
+    slow = ExpectationSuiteConfig.from_yaml(path)
+    fast = ExpectationSuiteConfig.from_yaml_fast(path)
+    assert fast.expectations[0].column == slow.expectations[0].column == "a"
+    (binding,) = fast.build_validators()
+    assert isinstance(binding[2], ColumnNotNull)
+
+
+def test_build_validators_ignores_empty_where(tmp_path):
+    path = tmp_path / "suite.yml"
+    path.write_text(
+        "suite_name: s\nengine: duck\ntable: t\nexpectations:\n"
+        "  - expectation_type: ColumnNotNull\n    column: a\n    where: ''\n"
+    )
+    for cfg in (
+        ExpectationSuiteConfig.from_yaml(path),
+        ExpectationSuiteConfig.from_yaml_fast(path),
+    ):
+        ((_, _, v),) = cfg.build_validators()
+        assert v.where_condition is None
+
+
+def test_peek_header(tmp_path):
+    path = tmp_path / "suite.yml"
+    path.write_text(
+        "suite_name: s\nengine: duck\ntable: t\nexpectations:\n"
+        "  - expectation_type: ColumnNotNull\n    column: a\n"
+    )
+    assert ExpectationSuiteConfig.peek_header(path) == {
+        "suite_name": "s",
+        "engine": "duck",
+        "table": "t",
+    }
+
+    # header keys after the body fall back to a full parse
+    path.write_text(
+        "suite_name: s\nexpectations: []\nengine: duck\ntable: t\n"
+    )
+    assert ExpectationSuiteConfig.peek_header(path)["table"] == "t"
+
+
+def test_resolve_validator_class_added_after_import(monkeypatch):
+    class LateValidator(ColumnNotNull):
+        pass
+
+    monkeypatch.setattr(column_mod, "LateValidator", LateValidator, raising=False)
+    _resolve_validator_class.cache_clear()
+    assert _resolve_validator_class("LateValidator") is LateValidator
+    _resolve_validator_class.cache_clear()
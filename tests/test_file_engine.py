@@ -28,6 +28,16 @@ def test_file_engine_glob(tmp_path):
     eng.close()
 
 
+def test_file_engine_json_glob(tmp_path):
+    for i in range(2):
+        (tmp_path / f"f{i}.json").write_text(f'{{"a": {i + 1}}}\n')
+
+    eng = FileEngine(str(tmp_path / "f*.json"), table="t")
+    df = eng.run_sql("SELECT SUM(a) AS s FROM t")
+    assert df.iloc[0]["s"] == 3
+    eng.close()
+
+
 def test_file_engine_cleanup(tmp_path):
     path = tmp_path / "data.csv"
     pd.DataFrame({"a": [1]}).to_csv(path, index=False)
@@ -63,3 +73,106 @@ def test_file_engine_file_metadata(tmp_path):
 
     path1.unlink()
     path2.unlink()
+
+
+def test_file_engine_file_metadata_many_files(tmp_path):
+    for i in range(80):
+        (tmp_path / f"f{i}.csv").write_text(f"a\n{i}\n")
+    (tmp_path / ".hidden.csv").write_text("a\n0\n")
+
+    eng = FileEngine(str(tmp_path / "f*.csv"), table="t")
+    meta = eng.file_metadata
+    assert len(meta) == 80
+    assert {Path(m["path"]).name for m in meta} == {f"f{i}.csv" for i in range(80)}
+    assert eng.file_metadata is meta
+    eng.close()
+
+
+def test_file_engine_parquet_glob(tmp_path):
+    import duckdb
+
+    con = duckdb.connect()
+    for i in range(3):
+        out = str(tmp_path / f"p{i}.parquet").replace("'", "''")
+        con.execute(f"COPY (SELECT {i} AS a) TO '{out}' (FORMAT parquet)")
+    con.close()
+
+    eng = FileEngine(str(tmp_path / "p*.parquet"), table="t")
+    df = eng.run_sql("SELECT SUM(a) AS s FROM t")
+    assert df.iloc[0]["s"] == 3
+    eng.close()
+
+
+def test_file_engine_run_sql_arrow(tmp_path):
+    import pytest
+
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "data.csv"
+    pd.DataFrame({"a": [1, 2]}).to_csv(path, index=False)
+
+    eng = FileEngine(path, table="t")
+    tbl = eng.run_sql_arrow("SELECT SUM(a) AS s FROM t")
+    assert tbl.column("s").to_pylist() == [3]
+    eng.close()
+
+
+def test_file_engine_list_columns_cached(tmp_path, monkeypatch):
+    path = tmp_path / "data.csv"
+    pd.DataFrame({"a": [1], "b": [2]}).to_csv(path, index=False)
+
+    eng = FileEngine(path, table="t")
+    calls = []
+    original = eng._duck.list_columns
+    monkeypatch.setattr(eng._duck, "list_columns", lambda t: calls.append(t) or original(t))
+
+    assert eng.list_columns("t") == ["a", "b"]
+    eng.list_columns("t").append("x")
+    assert eng.list_columns("t") == ["a", "b"]
+    assert calls == ["t"]
+
+    eng.invalidate_columns("t")
+    eng.list_columns("t")
+    assert calls == ["t", "t"]
+    eng.close()
+
+
+def test_file_engine_metadata_aggregates(tmp_path):
+    (tmp_path / "a.csv").write_text("a\n1\n")
+    (tmp_path / "b.csv").write_text("a\n22\n")
+
+    eng = FileEngine(str(tmp_path / "*.csv"), table="t")
+    arrays = eng.file_metadata_arrays
+    assert arrays.total_size() == sum(m["size"] for m in eng.file_metadata)
+    assert arrays.max_mtime() == max(m["modified"] for m in eng.file_metadata)
+    eng.close()
+
+
+def test_file_engine_file_metadata_is_a_list(tmp_path):
+    import json
+
+    path = tmp_path / "data.csv"
+    path.write_text("a\n1\n")
+    st = os.stat(path)
+
+    eng = FileEngine(path, table="t")
+    expected = [{"path": str(path.resolve()), "size": st.st_size, "modified": st.st_mtime}]
+    assert eng.file_metadata == expected
+    assert eng.file_metadata[0]["size"] == st.st_size
+    assert json.loads(json.dumps(eng.file_metadata)) == expected
+    eng.close()
+
+
+def test_file_engine_recursive_glob(tmp_path):
+    import duckdb
+
+    con = duckdb.connect()
+    for rel, value in [("x.parquet", 10), ("year=2023/a.parquet", 1), ("year=2024/m=1/b.parquet", 100)]:
+        out = tmp_path / rel
+        out.parent.mkdir(parents=True, exist_ok=True)
+        con.execute(f"COPY (SELECT {value} AS a) TO '{str(out).replace(chr(39), chr(39) * 2)}' (FORMAT parquet)")
+    con.close()
+
+    eng = FileEngine(str(tmp_path / "**" / "*.parquet"), table="t")
+    assert eng.run_sql("SELECT SUM(a) AS s FROM t").iloc[0]["s"] == 111
+    assert len(eng.file_metadata) == 3
+    eng.close()
@@ -63,3 +63,20 @@ def test_pct_where_builder(tmp_path):
     expr = builder("a")
     val = _run_expr(eng, "t", expr)
     assert val == approx(2 / 3)
+
+
+def test_pct_where_rejects_bad_predicate_eagerly():
+    import pytest
+
+    from src.expectations.errors import ValidationConfigError
+    from src.expectations.metrics.registry import pct_where
+
+    with pytest.raises(ValidationConfigError):
+        pct_where("1; DROP TABLE t")
+
+
+def test_pct_where_builders_are_shared():
+    from src.expectations.metrics.registry import pct_where
+
+    assert pct_where("b = 1") is pct_where("b = 1")
+    assert pct_where("b = 1") is not pct_where("b = 2")
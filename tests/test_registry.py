@@ -4,7 +4,7 @@ from sqlglot import exp
 from src.expectations.metrics import registry
 
 
-def test_register_metric_duplicate_key():
+def test_register_metric_duplicate_key(restore_metric_registry):
     @registry.register_metric("_dup")
     def _metric(col: str) -> exp.Expression:
         return exp.column(col)
@@ -13,11 +13,50 @@ def test_register_metric_duplicate_key():
         @registry.register_metric("_dup")
         def _metric2(col: str) -> exp.Expression:  # pragma: no cover - should not be executed
             return exp.column(col)
-    # cleanup
-    registry.MetricRegistry.instance()._metrics.pop("_dup", None)
 
 
 def test_builtin_metric_retrieval():
     for name in registry.available_metrics():
         expr = registry.get_metric(name)("col")
         assert isinstance(expr, exp.Expression)
+
+
+def test_build_metric_returns_independent_copies():
+    first = registry.build_metric("max", "col")
+    second = registry.build_metric("max", "col")
+    assert first == second and first is not second
+    first.set("this", exp.column("other"))
+    assert registry.build_metric("max", "col").sql() == "MAX(col)"
+
+
+def test_metrics_snapshot_is_read_only():
+    snap = registry.metrics_snapshot()
+    assert snap["max"] is registry.get_metric("max")
+    with pytest.raises(TypeError):
+        snap["max"] = None  # type: ignore[index]
+
+
+def test_register_pct_where_idempotent(restore_metric_registry):
+    first = registry.register_pct_where("_pct_active", "a = 1")
+    assert registry.register_pct_where("_pct_active", "a = 1") is first
+    assert registry.get_metric("_pct_active") is first
+    with pytest.raises(KeyError):
+        registry.register_pct_where("_pct_active", "a = 2")
+
+
+def test_register_pct_where_idempotent_after_cache_eviction(restore_metric_registry):
+    first = registry.register_pct_where("_pct_evicted", "a = 1")
+    registry.pct_where.cache_clear()
+    assert registry.register_pct_where("_pct_evicted", "a = 1") is first
+    with pytest.raises(KeyError):
+        registry.register_pct_where("_pct_evicted", "a = 2")
+
+
+def test_unregister_metric_bumps_version(restore_metric_registry):
+    registry.register_pct_where("_pct_gone", "a = 1")
+    version = registry.MetricRegistry.instance().version
+    registry.unregister_metric("_pct_gone")
+    assert registry.MetricRegistry.instance().version == version + 1
+    assert "_pct_gone" not in registry.available_metrics()
+    with pytest.raises(KeyError):
+        registry.unregister_metric("_pct_gone")
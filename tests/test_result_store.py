@@ -102,3 +102,115 @@ def test_duckdb_store_persist_sla(tmp_path):
     assert df_runs.loc[0, "engine_name"] == "duck"
     assert df_runs.loc[0, "sla_name"] == "sla1"
     assert len(df_slas) == 1
+
+
+def test_duckdb_store_bulk_values_match_parameter_casts():
+    import numpy as np
+
+    from src.expectations.result_model import RunMetadata, ValidationResult
+
+    store = DuckDBResultStore()
+    run = RunMetadata(suite_name="bulk")
+    values = [True, np.int64(3), np.float64(0.5), None, "x", float("nan")]
+    results = [
+        ValidationResult(run_id=run.run_id, validator="V", table="t", success=True, value=v)
+        for v in values
+    ]
+    store.persist_run(run, results)
+    store.persist_run(
+        RunMetadata(suite_name="none"),
+        [ValidationResult(run_id="n", validator="V", table="t", success=False, value=None)],
+    )
+
+    got = [
+        row[0]
+        for row in store.connection.execute(
+            "SELECT value FROM results WHERE run_id = ? ORDER BY rowid", (run.run_id,)
+        ).fetchall()
+    ]
+    assert got == ["true", "3", "0.5", None, "x", "nan"]
+    assert store.connection.execute(
+        "SELECT value, success FROM results WHERE run_id = 'n'"
+    ).fetchall() == [(None, False)]
+
+
+def test_duckdb_store_persist_run_is_atomic():
+    import pytest
+
+    from src.expectations.result_model import RunMetadata, ValidationResult
+
+    store = DuckDBResultStore()
+    run = RunMetadata(suite_name="atomic")
+    bad = ValidationResult(
+        run_id=run.run_id, validator="V", table="t", success=True, value=1,
+        details={"unserialisable": object()},
+    )
+    with pytest.raises(TypeError):
+        store.persist_run(run, [bad])
+    assert store.connection.execute("SELECT count(*) FROM runs").fetchone() == (0,)
+
+    store.persist_run(run, [])  # the connection is usable again
+    assert store.connection.execute("SELECT count(*) FROM runs").fetchone() == (1,)
+
+
+def test_file_store_compressed(tmp_path):
+    import gzip
+
+    engine = DuckDBEngine()
+    store = FileResultStore(tmp_path, compress=True)
+    engine.register_dataframe("t", pd.DataFrame({"a": [1]}))
+    runner = ValidationRunner({"duck": engine})
+
+    run, _ = run_validations(
+        suite_name="suite1",
+        bindings=[("duck", "t", ColumnNotNull(column="a"))],
+        runner=runner,
+        store=store,
+    )
+
+    res_file = tmp_path / "results" / f"{run.run_id}.jsonl.gz"
+    assert res_file.exists()
+    assert not (tmp_path / "results" / f"{run.run_id}.jsonl").exists()
+    with gzip.open(res_file, "rt") as fh:
+        results = [json.loads(line) for line in fh]
+    assert len(results) == 1 and results[0]["engine_name"] == "duck"
+
+
+def test_duckdb_store_concurrent_persist(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from src.expectations.result_model import RunMetadata, ValidationResult
+
+    store = DuckDBResultStore(DuckDBEngine(tmp_path / "res.db"))
+
+    def persist(i):
+        run = RunMetadata(suite_name=f"s{i}")
+        results = [
+            ValidationResult(run_id=run.run_id, validator="V", table="t", success=True, value=j)
+            for j in range(50)
+        ]
+        store.persist_run(run, results)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(persist, range(8)))
+
+    assert store.connection.execute("SELECT count(*) FROM runs").fetchone() == (8,)
+    assert store.connection.execute("SELECT count(*) FROM results").fetchone() == (400,)
+
+
+def test_duckdb_store_details_json_independent_of_orjson(monkeypatch):
+    import numpy as np
+    import src.expectations.store.duckdb as store_mod
+
+    details = {
+        "big": 1e20,
+        "small": 1e-7,
+        "nan": float("nan"),
+        "text": "café 1e+05",
+        "vals": np.array([0.1, np.inf], dtype=np.float32),
+        "n": np.int64(3),
+    }
+    expected = '{"big":1e20,"small":1e-7,"nan":null,"text":"café 1e+05","vals":[0.1,null],"n":3}'
+    assert store_mod._details_json(details) == expected
+    monkeypatch.setattr(store_mod, "_orjson_dumps", None)
+    assert store_mod._details_json(details) == expected
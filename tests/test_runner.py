@@ -81,3 +81,139 @@ def test_metric_error_capture():
     assert "error" in res.details
     assert "traceback" in res.details
 
+
+
+def test_metric_groups_fused_per_engine(monkeypatch):
+    eng = DuckDBEngine()
+    eng.register_dataframe("t1", pd.DataFrame({"a": [1, 2]}))
+    eng.register_dataframe("t2", pd.DataFrame({"a": [1, None]}))
+    calls = []
+    original = eng.run_sql
+
+    def spy(sql):
+        calls.append(sql)
+        return original(sql)
+
+    monkeypatch.setattr(eng, "run_sql", spy)
+
+    runner = ValidationRunner({"duck": eng})
+    results = runner.run(
+        [
+            ("duck", "t1", ColumnNotNull(column="a")),
+            ("duck", "t2", ColumnNotNull(column="a")),
+        ],
+        run_id="test",
+    )
+    assert len(calls) == 1
+    assert [r.success for r in results] == [True, False]
+
+
+def test_fused_failure_isolated_per_table():
+    eng = DuckDBEngine()
+    eng.register_dataframe("t", pd.DataFrame({"a": [1, 2]}))
+
+    runner = ValidationRunner({"duck": eng})
+    results = runner.run(
+        [
+            ("duck", "t", ColumnNotNull(column="a")),
+            ("duck", "missing", ColumnNotNull(column="a")),
+        ],
+        run_id="test",
+    )
+    by_table = {r.table: r for r in results}
+    assert by_table["t"].success is True
+    assert by_table["missing"].success is False
+    assert "error" in by_table["missing"].details
+
+
+def test_repeated_runs_reuse_batch_sql(monkeypatch):
+    from src.expectations.metrics import batch_builder
+
+    eng = DuckDBEngine()
+    eng.register_dataframe("t", pd.DataFrame({"a": [1, 2]}))
+    runner = ValidationRunner({"duck": eng})
+    bindings = [("duck", "t", ColumnNotNull(column="a"))]
+
+    ValidationRunner.clear_sql_cache()
+    runner.run(bindings, run_id="r1")
+    assert len(batch_builder._SQL_CACHE) == 1
+
+    def fail(self, version):  # pragma: no cover - must not be reached
+        raise AssertionError("batch SQL was re-rendered")
+
+    monkeypatch.setattr(batch_builder.MetricBatchBuilder, "_render", fail)
+    assert runner.run(bindings, run_id="r2")[0].success is True
+
+
+def test_engines_run_concurrently_in_binding_order():
+    import threading
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    class BarrierEngine(DuckDBEngine):
+        def run_sql(self, sql):
+            barrier.wait()  # deadlocks unless both engines query at once
+            return super().run_sql(sql)
+
+    engines = {}
+    for key in ("e1", "e2"):
+        eng = BarrierEngine()
+        eng.register_dataframe("t", pd.DataFrame({"a": [1, None] if key == "e2" else [1, 2]}))
+        engines[key] = eng
+
+    runner = ValidationRunner(engines, max_workers=2)
+    results = runner.run(
+        [("e1", "t", ColumnNotNull(column="a")), ("e2", "t", ColumnNotNull(column="a"))],
+        run_id="test",
+    )
+    assert [r.success for r in results] == [True, False]
+
+
+def test_engines_keep_connection_state_by_default():
+    engines = {}
+    for key in ("e1", "e2"):
+        eng = DuckDBEngine()
+        eng.run_sql("CREATE TEMP TABLE t AS SELECT 1 AS a")
+        engines[key] = eng
+
+    results = ValidationRunner(engines).run(
+        [("e1", "t", ColumnNotNull(column="a")), ("e2", "t", ColumnNotNull(column="a"))],
+        run_id="test",
+    )
+    assert [r.success for r in results] == [True, True]
+
+
+def test_keys_sharing_an_engine_use_one_thread():
+    import threading
+
+    threads = set()
+
+    class RecordingEngine(DuckDBEngine):
+        def run_sql(self, sql):
+            threads.add(threading.get_ident())
+            return super().run_sql(sql)
+
+    shared = RecordingEngine()
+    shared.register_dataframe("t", pd.DataFrame({"a": [1]}))
+    other = DuckDBEngine()
+    other.register_dataframe("t", pd.DataFrame({"a": [1]}))
+
+    runner = ValidationRunner({"k1": shared, "k2": shared, "k3": other}, max_workers=3)
+    results = runner.run(
+        [(k, "t", ColumnNotNull(column="a")) for k in ("k1", "k2", "k3")], run_id="test"
+    )
+    assert [r.success for r in results] == [True, True, True]
+    assert len(threads) == 1
+
+
+def test_metric_results_follow_first_appearance_of_groups():
+    e1, e2 = DuckDBEngine(), DuckDBEngine()
+    for eng in (e1, e2):
+        eng.register_dataframe("t1", pd.DataFrame({"a": [1]}))
+        eng.register_dataframe("t2", pd.DataFrame({"a": [1]}))
+    v1, v2, v3 = (ColumnNotNull(column="a") for _ in range(3))
+
+    results = ValidationRunner({"e1": e1, "e2": e2}).run(
+        [("e1", "t1", v1), ("e2", "t1", v2), ("e1", "t2", v3)], run_id="test"
+    )
+    assert [r.table for r in results] == ["t1", "t1", "t2"]
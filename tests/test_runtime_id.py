@@ -16,3 +16,24 @@ def test_runtime_id_unique_large_sample():
     ids = {_Dummy().runtime_id for _ in range(1_000_000)}
     assert len(ids) == 1_000_000
     assert all(len(i) < 63 for i in ids)
+
+
+def test_runtime_id_uses_child_pid_after_fork():
+    import os
+
+    import pytest
+
+    if not hasattr(os, "fork"):
+        pytest.skip("fork not available")
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - child process
+        os.close(read_fd)
+        os.write(write_fd, _Dummy().runtime_id.encode())
+        os._exit(0)
+    os.close(write_fd)
+    child_id = os.read(read_fd, 128).decode()
+    os.close(read_fd)
+    os.waitpid(pid, 0)
+    assert child_id.startswith(f"v{pid}_")
+    assert _Dummy().runtime_id.startswith(f"v{os.getpid()}_")
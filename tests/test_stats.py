@@ -27,3 +27,58 @@ def test_collect_and_persist_stats(tmp_path):
     assert {"row_cnt", "null_pct", "min", "max"}.issubset(set(df_stats["metric"]))
     row_cnt = float(df_stats[df_stats["metric"] == "row_cnt"]["value"].iloc[0])
     assert row_cnt == 3.0
+
+
+def test_run_with_stats_shares_validation_query(monkeypatch):
+    from src.expectations.runner import ValidationRunner
+    from src.expectations.validators.column import ColumnNotNull
+
+    eng = DuckDBEngine()
+    eng.register_dataframe("t", pd.DataFrame({"a": [1, 2, None], "b": [5, 6, 7]}))
+    eng.register_dataframe("u", pd.DataFrame({"c": [1, 1]}))
+    collector = TableStatsCollector({"duck": eng})
+    expected = {
+        (s.table, s.column, s.metric): s.value
+        for table in ("t", "u")
+        for s in collector.collect("duck", table, run_id="r")
+    }
+
+    calls = []
+    original = eng.run_sql
+
+    def spy(sql):
+        calls.append(sql)
+        return original(sql)
+
+    monkeypatch.setattr(eng, "run_sql", spy)
+
+    runner = ValidationRunner({"duck": eng})
+    results, stats = runner.run_with_stats(
+        [("duck", "t", ColumnNotNull(column="a")), ("duck", "u", ColumnNotNull(column="c"))],
+        collector,
+        run_id="r",
+    )
+    assert len(calls) == 1
+    assert [r.success for r in results] == [False, True]
+    got = {(s.table, s.column, s.metric): s.value for s in stats}
+    assert got.keys() == expected.keys()
+    for key, value in expected.items():
+        assert got[key] == value or (pd.isna(got[key]) and pd.isna(value))
+
+
+def test_run_with_stats_missing_table_fails_without_stats():
+    from src.expectations.runner import ValidationRunner
+    from src.expectations.validators.column import ColumnNotNull
+
+    eng = DuckDBEngine()
+    eng.register_dataframe("t", pd.DataFrame({"a": [1, 2]}))
+    collector = TableStatsCollector({"duck": eng})
+
+    results, stats = ValidationRunner({"duck": eng}).run_with_stats(
+        [("duck", "t", ColumnNotNull(column="a")), ("duck", "missing", ColumnNotNull(column="a"))],
+        collector,
+        run_id="r",
+    )
+    assert [r.success for r in results] == [True, False]
+    assert "error" in results[1].details
+    assert stats and {s.table for s in stats} == {"t"}